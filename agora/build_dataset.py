@@ -1,17 +1,42 @@
 import os
+import re
 import sys
 import csv
 import math
 import json
-from datetime import datetime
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from multiprocessing import Pool, cpu_count
 
+import numpy as np
 import pandas as pd
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from langdetect import detect, DetectorFactory
+from langdetect import detect, DetectorFactory, detector_factory
+from langdetect.utils.lang_profile import LangProfile
+
+# Optional: Google's compact language detector (C++); langdetect is the fallback
+try:
+    import cld3
+    CLD3_AVAILABLE = True
+except ImportError:
+    CLD3_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Make langdetect deterministic
 DetectorFactory.seed = 0
 
+# Only load n-gram profiles for languages that plausibly appear in the corpus;
+# detection cost and per-worker memory both scale with the number of profiles
+LANGDETECT_LANGS = ('en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko',
+                    'zh-cn', 'zh-tw', 'ar', 'hi', 'id', 'nl')
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 AUTH_PATH = os.path.join(BASE_DIR, 'authorities.csv')
@@ -19,6 +44,17 @@ COLL_PATH = os.path.join(BASE_DIR, 'collections.csv')
 DOCS_PATH = os.path.join(BASE_DIR, 'documents.csv')
 FULLTEXT_DIR = os.path.join(BASE_DIR, 'fulltext')
 OUT_PATH = os.path.join(BASE_DIR, 'clean_dataset.csv')
+CACHE_DIR = os.path.join(BASE_DIR, 'cache')
+
+# Runs of 5+ identical punctuation/emoji characters; VADER slows down badly on
+# dense emoticon runs, and caps '!'/'?' emphasis at 4 so longer runs add nothing
+_PUNCT_RUN_RE = re.compile(r'([^\w\s])\1{4,}')
+
+# Content shorter than this gives no usable sentiment/language signal
+MIN_ANALYSIS_CHARS = 20
+
+_WS_RE = re.compile(r'\s+')
+_URL_RE = re.compile(r'(?:^|(?<=[\s;]))https?://[^\s;]*')
 
 REQUIRED_COLUMNS = [
     'id','title','authority','country','region','topic','document_type','date','year','month',
@@ -26,10 +62,32 @@ REQUIRED_COLUMNS = [
     'status','content','url','language','tags'
 ]
 
+# Free-text columns that must stay strings even when every value looks like a date
+TEXT_COLUMNS = [
+    'Official name', 'Casual name', 'Link to document', 'Authority', 'Collections',
+    'Most recent activity', 'Most recent activity date', 'Proposed date',
+    'Short summary', 'Long summary', 'Tags', 'Official plaintext retrieved',
+    'Official plaintext source', 'Official pdf source', 'Official pdf retrieved',
+]
+
 
 def read_csv_safe(path: str) -> pd.DataFrame:
     if not os.path.exists(path):
         raise FileNotFoundError(f'Missing file: {path}')
+    if PYARROW_AVAILABLE:
+        # Multithreaded Arrow parser; Arrow-backed columns avoid a PyObject per cell
+        try:
+            table = pa_csv.read_csv(
+                path,
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={c: pa.string() for c in TEXT_COLUMNS},
+                    strings_can_be_null=True,
+                ),
+            )
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        except Exception:
+            pass
     # Try common encodings
     for enc in ('utf-8-sig', 'utf-8', 'cp1252'):
         try:
@@ -40,51 +98,82 @@ def read_csv_safe(path: str) -> pd.DataFrame:
     return pd.read_csv(path, encoding_errors='ignore')
 
 
-def load_fulltext(doc_id: int) -> str:
-    # Files are named like "{id}.txt"
-    path = os.path.join(FULLTEXT_DIR, f"{int(doc_id)}.txt")
-    if os.path.exists(path):
+def read_csv_as_dicts(path: str) -> list[dict[str, str]]:
+    """Read a small CSV straight into row dicts (no pandas needed)."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f'Missing file: {path}')
+    for enc in ('utf-8-sig', 'cp1252'):
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return f.read().strip()
+            with open(path, 'r', encoding=enc, newline='') as f:
+                return list(csv.DictReader(f))
         except UnicodeDecodeError:
-            with open(path, 'r', encoding='cp1252', errors='ignore') as f:
-                return f.read().strip()
-    return ''
+            continue
+    with open(path, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+_FULLTEXT_INDEX: dict[int, str] | None = None
+
+
+def fulltext_index() -> dict[int, str]:
+    """Map doc id -> path for every "{id}.txt" in FULLTEXT_DIR, scanned once per process."""
+    global _FULLTEXT_INDEX
+    if _FULLTEXT_INDEX is None:
+        index = {}
+        if os.path.isdir(FULLTEXT_DIR):
+            with os.scandir(FULLTEXT_DIR) as entries:
+                for entry in entries:
+                    stem = entry.name[:-4]
+                    if entry.name.endswith('.txt') and stem.isdigit() and entry.is_file():
+                        index[int(stem)] = entry.path
+        _FULLTEXT_INDEX = index
+    return _FULLTEXT_INDEX
+
+
+def load_fulltext(doc_id: int) -> str:
+    path = fulltext_index().get(int(doc_id))
+    if not path:
+        return ''
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except UnicodeDecodeError:
+        with open(path, 'r', encoding='cp1252', errors='ignore') as f:
+            return f.read().strip()
+
+
+def prefetch_fulltexts(doc_ids: pd.Series, max_workers: int = 16) -> list[str]:
+    """Read every available fulltext concurrently; returns texts aligned with doc_ids."""
+    ids = pd.to_numeric(doc_ids, errors='coerce').astype('Int64')
+    ids = [None if pd.isna(k) else int(k) for k in ids]
+    index = fulltext_index()
+    wanted = sorted({k for k in ids if k in index})
+    # File reads are latency-bound and release the GIL, so threads overlap them
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        texts = dict(zip(wanted, ex.map(load_fulltext, wanted)))
+    return [texts.get(k, '') for k in ids]
 
 
 def sanitize_text(text: str, max_len: int | None = None) -> str:
     """Remove newlines, collapse whitespace, strip non-printable edges, and optionally truncate."""
     if not isinstance(text, str):
         return ''
-    t = text.replace('\r', ' ').replace('\n', ' ')
-    # collapse spaces
-    t = ' '.join(t.split())
+    # \s covers newlines too and matches exactly what str.split() treats as whitespace
+    t = _WS_RE.sub(' ', text).strip()
     if max_len is not None and len(t) > max_len:
         t = t[:max_len].rstrip()
     return t
 
 
 def first_valid_url(value: str) -> str:
-    if not isinstance(value, str) or not value.strip():
+    if not isinstance(value, str):
         return ''
-    # Split on common separators
-    parts = []
-    for sep in [';', '|', ',', '\n', '\r']:
-        if sep in value:
-            value = value.replace('\r', ' ').replace('\n', ' ')
-    parts = [p.strip() for p in value.split(' ') if p.strip()]
-    # Also consider semicolon-separated within tokens
-    flat = []
-    for p in parts:
-        flat.extend([x for x in p.split(';') if x])
-    for p in flat:
-        if p.startswith('http://') or p.startswith('https://'):
-            return p
-    return ''
+    # First whitespace/semicolon-delimited token that starts with http(s)://
+    m = _URL_RE.search(value)
+    return m.group(0) if m else ''
 
 
-def choose_best_url(row: pd.Series) -> str:
+def choose_best_url(row: dict) -> str:
     # Priority: Official pdf source (if present and looks like URL) > Official plaintext source > Link to document
     pdf_src = row.get('Official pdf source')
     pdf_retrieved = str(row.get('Official pdf retrieved', '')).strip().lower()
@@ -104,47 +193,63 @@ def choose_best_url(row: pd.Series) -> str:
     return ''
 
 
-def normalize_date(row) -> tuple[str|None, int|None, int|None]:
-    # Prefer Most recent activity date, else Proposed date
-    for col in ('Most recent activity date', 'Proposed date'):
-        val = str(row.get(col, '')).strip()
-        if val and val.lower() != 'nan':
-            try:
-                # Try ISO first
-                dt = datetime.fromisoformat(val)
-            except Exception:
-                # Try common patterns
-                for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d", "%d-%m-%Y", "%Y-%m", "%Y"):
-                    try:
-                        dt = datetime.strptime(val, fmt)
-                        break
-                    except Exception:
-                        dt = None
-                if dt is None:
-                    return None, None, None
-            return dt.date().isoformat(), dt.year, dt.month
-    return None, None, None
-
-
-def infer_doc_type(title: str, collections: str) -> str:
-    t = (title or '').lower()
-    c = (collections or '').lower()
-    if 'executive order' in t:
-        return 'Executive Order'
-    if 'bill' in t or 'act' in t:
-        return 'Law/Act'
-    if 'regulation' in t or 'regulations' in t or 'regulation' in c or 'regulations' in c:
-        return 'Regulation'
-    if 'resolution' in t:
-        return 'Resolution'
-    if 'policy' in t or 'policies' in t:
-        return 'Policy/Guidance'
-    # From collection hints
-    if 'federal laws' in c or 'ndaa' in c:
-        return 'Law/Act'
-    if 'state and local' in c:
-        return 'State/Local Law or Policy'
-    return 'Other'
+def _parse_date_column(docs: pd.DataFrame, col: str) -> tuple[pd.Series, pd.Series]:
+    """Return (present mask, parsed datetimes) for a raw date column."""
+    if col not in docs.columns:
+        missing = pd.Series(False, index=docs.index)
+        return missing, pd.Series(pd.NaT, index=docs.index, dtype='datetime64[ns]')
+    raw = docs[col].astype('string').str.strip()
+    present = (raw.notna() & (raw != '') & (raw.str.lower() != 'nan')).fillna(False).astype(bool)
+    return present, pd.to_datetime(raw.where(present), errors='coerce', format='mixed')
+
+
+def normalize_dates(docs: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized date/year/month for every row ('' when unknown)."""
+    # Prefer Most recent activity date, else Proposed date. An unparseable
+    # activity date does not fall back to the proposed date.
+    mra_present, mra = _parse_date_column(docs, 'Most recent activity date')
+    _, proposed = _parse_date_column(docs, 'Proposed date')
+    dates = mra.where(mra_present, proposed)
+    valid = dates.notna()
+    return pd.DataFrame({
+        'date': dates.dt.strftime('%Y-%m-%d').where(valid, ''),
+        'year': dates.dt.year.astype('Int64').astype(object).where(valid, ''),
+        'month': dates.dt.month.astype('Int64').astype(object).where(valid, ''),
+    }, index=docs.index)
+
+
+def build_titles(docs: pd.DataFrame) -> pd.Series:
+    """Official name when non-blank, else casual name; sanitized and capped at 300 chars."""
+    official = docs['Official name']
+    has_official = official.notna() & official.astype('string').str.strip().ne('').fillna(False).astype(bool)
+    title_raw = official.where(has_official, docs['Casual name'])
+    return title_raw.map(lambda t: sanitize_text(t, max_len=300)).astype(object)
+
+
+def infer_doc_types(titles: pd.Series, collections: pd.Series) -> np.ndarray:
+    """Vectorized document type from title and collection keywords (first match wins)."""
+    t = titles.fillna('').astype('string').str.lower()
+    c = collections.fillna('').astype('string').str.lower()
+
+    def has(s: pd.Series, *words: str) -> np.ndarray:
+        mask = np.zeros(len(s), dtype=bool)
+        for w in words:
+            mask |= s.str.contains(w, regex=False).fillna(False).to_numpy(dtype=bool)
+        return mask
+
+    conditions = [
+        has(t, 'executive order'),
+        has(t, 'bill', 'act'),
+        has(t, 'regulation') | has(c, 'regulation'),
+        has(t, 'resolution'),
+        has(t, 'policy', 'policies'),
+        # From collection hints
+        has(c, 'federal laws', 'ndaa'),
+        has(c, 'state and local'),
+    ]
+    choices = ['Executive Order', 'Law/Act', 'Regulation', 'Resolution', 'Policy/Guidance',
+               'Law/Act', 'State/Local Law or Policy']
+    return np.select(conditions, choices, default='Other')
 
 
 def extract_topic(tags: str, collections: str) -> str:
@@ -157,25 +262,24 @@ def extract_topic(tags: str, collections: str) -> str:
     return ''
 
 
-def normalize_tags(tags: str) -> str:
-    if not isinstance(tags, str) or not tags.strip():
-        return ''
-    parts = [p.strip() for p in tags.replace('|', ';').split(';') if p.strip()]
-    # Deduplicate while preserving order
-    seen = set()
-    norm = []
-    for p in parts:
-        if p not in seen:
-            seen.add(p)
-            norm.append(p)
+def normalize_tags_list(parts: list[str]) -> str:
+    # Strip, drop empties and deduplicate while preserving order
+    norm = list(dict.fromkeys(p for p in (p.strip() for p in parts) if p))
     # Limit to top 15 to keep CSV manageable
     return ', '.join(norm[:15])
 
 
+def normalize_tags(tags: pd.Series) -> list[str]:
+    """Normalize a whole Tags column; separators ';' and '|' are treated alike."""
+    tags_series = tags.fillna('').astype('string').str.replace('|', ';', regex=False)
+    return [normalize_tags_list(s.split(';')) for s in tags_series]
+
+
 def compute_sentiment(text: str, analyzer: SentimentIntensityAnalyzer) -> tuple[str, float]:
     sample = (text or '')
     if len(sample) > 8000:
         sample = sample[:8000]
+    sample = _PUNCT_RUN_RE.sub(r'\1\1\1\1', sample)
     if not sample.strip():
         return 'neutral', 0.0
     score = analyzer.polarity_scores(sample)['compound']
@@ -188,30 +292,19 @@ def compute_sentiment(text: str, analyzer: SentimentIntensityAnalyzer) -> tuple[
     return label, float(score)
 
 
-def compute_risk(row: pd.Series, risk_cols: list[str], harm_cols: list[str]) -> tuple[str, float]:
-    total_cols = len(risk_cols) + len(harm_cols)
-    if total_cols == 0:
-        return 'low', 0.0
-    positives = 0
-    for col in risk_cols + harm_cols:
-        val = row.get(col)
-        if isinstance(val, bool):
-            positives += 1 if val else 0
-        else:
-            # Interpret strings like 'True', 'False'
-            if str(val).strip().lower() in ('true', '1', 'yes'):
-                positives += 1
-    score = positives / total_cols
-    if score < 0.34:
-        level = 'low'
-    elif score < 0.67:
-        level = 'medium'
-    else:
-        level = 'high'
-    return level, float(round(score, 4))
+def compute_risks(docs: pd.DataFrame, risk_cols: list[str], harm_cols: list[str]) -> pd.DataFrame:
+    """Vectorized risk level/score: share of risk and harm flags that are set."""
+    cols = risk_cols + harm_cols
+    if not cols:
+        return pd.DataFrame({'risk_level': 'low', 'risk_score': 0.0}, index=docs.index)
+    # Booleans stringify to 'True'/'False', so one rule covers bool and text columns
+    flags = docs[cols].astype(str).apply(lambda s: s.str.strip().str.lower()).isin(('true', '1', 'yes'))
+    score = flags.to_numpy(dtype=bool).sum(axis=1) / len(cols)
+    level = np.where(score < 0.34, 'low', np.where(score < 0.67, 'medium', 'high'))
+    return pd.DataFrame({'risk_level': level, 'risk_score': np.round(score, 4)}, index=docs.index)
 
 
-def compute_confidence(row: pd.Series) -> float:
+def compute_confidence(row: dict) -> float:
     annotated = str(row.get('Annotated?', '')).strip().lower() == 'true'
     validated = str(row.get('Validated?', '')).strip().lower() == 'true'
     if validated:
@@ -221,22 +314,45 @@ def compute_confidence(row: pd.Series) -> float:
     return 0.5
 
 
-def authority_country_region(authority: str, auth_df: pd.DataFrame) -> tuple[str|None, str|None]:
-    if not isinstance(authority, str) or not authority.strip():
-        return None, None
-    # Exact match first
-    match = auth_df.loc[auth_df['Name'] == authority]
-    if len(match) == 0:
-        # Try case-insensitive
-        match = auth_df.loc[auth_df['Name'].str.lower() == authority.lower()]
-    if len(match) == 0:
-        return None, None
-    country = match.iloc[0].get('Jurisdiction')
-    parent = match.iloc[0].get('Parent authority')
+def authority_country_region(authorities: pd.Series, auth_rows: list[dict[str, str]]) -> pd.DataFrame:
+    """Join documents to authorities.csv on lowercased name -> country/region ('' when unknown)."""
+    auth = pd.DataFrame(auth_rows, columns=['Name', 'Jurisdiction', 'Parent authority']).fillna('')
+    auth['_name_lc'] = auth['Name'].astype('string').str.lower()
+    # First row wins on duplicate names; blank names never match
+    auth = auth[auth['_name_lc'].str.strip().ne('')].drop_duplicates('_name_lc')
+    keys = pd.DataFrame({'_auth_lc': authorities.fillna('').astype('string').str.lower()})
+    merged = keys.merge(auth, left_on='_auth_lc', right_on='_name_lc', how='left')
+    country = merged['Jurisdiction'].fillna('').astype(object)
+    parent = merged['Parent authority'].fillna('').astype(object)
+    country = country.where(country.str.strip().ne(''), '')
     # Region preference: parent if available else country
-    region = parent if isinstance(parent, str) and parent.strip() else country
-    return (country if isinstance(country, str) and country.strip() else None,
-            region if isinstance(region, str) and region.strip() else None)
+    region = parent.where(parent.str.strip().ne(''), country)
+    return pd.DataFrame({'country': country.to_numpy(), 'region': region.to_numpy()}, index=authorities.index)
+
+
+def init_langdetect_profiles() -> None:
+    """Install a langdetect factory holding only LANGDETECT_LANGS (no-op once loaded)."""
+    if detector_factory._factory is not None:
+        return
+    factory = DetectorFactory()
+    for index, lang in enumerate(LANGDETECT_LANGS):
+        with open(os.path.join(detector_factory.PROFILES_DIRECTORY, lang), 'r', encoding='utf-8') as f:
+            factory.add_profile(LangProfile(**json.load(f)), index, len(LANGDETECT_LANGS))
+    detector_factory._factory = factory
+
+
+@lru_cache(maxsize=8192)
+def _detect_sample(sample: str) -> str:
+    # Cached per process; many rows share the same summary text
+    if CLD3_AVAILABLE:
+        result = cld3.get_language(sample)
+        if result is not None and result.is_reliable:
+            return result.language
+    init_langdetect_profiles()
+    try:
+        return detect(sample)
+    except Exception:
+        return ''
 
 
 def detect_language(text: str) -> str:
@@ -244,114 +360,179 @@ def detect_language(text: str) -> str:
     if not sample:
         return ''
     # Use first 2000 chars for speed
-    sample = sample[:2000]
+    return _detect_sample(sample[:2000])
+
+
+_ANALYZER: SentimentIntensityAnalyzer | None = None
+
+
+def _init_worker(analyzer: SentimentIntensityAnalyzer) -> None:
+    # Reuse the parent's analyzer: shared copy-on-write under fork, and only
+    # unpickled (not re-parsed from the lexicon file) under spawn
+    global _ANALYZER
+    _ANALYZER = analyzer
+    init_langdetect_profiles()
+
+
+def _get_analyzer() -> SentimentIntensityAnalyzer:
+    global _ANALYZER
+    if _ANALYZER is None:
+        _ANALYZER = SentimentIntensityAnalyzer()
+    return _ANALYZER
+
+
+def process_row(item: tuple[int, dict]) -> dict | None:
+    """Build one output record from a documents.csv row; returns None if the row is skipped."""
+    idx, row = item
     try:
-        return detect(sample)
-    except Exception:
-        return ''
+        doc_id = row.get('AGORA ID')
+        if pd.isna(doc_id):
+            return None
+        try:
+            doc_id_int = int(doc_id)
+        except Exception:
+            # some IDs may be strings; attempt to coerce
+            doc_id_int = int(str(doc_id).strip())
+
+        title = row['title']
+        authority = row.get('Authority') if isinstance(row.get('Authority'), str) else ''
+        url = choose_best_url(row)
+        collections = row.get('Collections') if isinstance(row.get('Collections'), str) else ''
+        tags_raw = row.get('Tags') if isinstance(row.get('Tags'), str) else ''
+        status = row.get('Most recent activity') if isinstance(row.get('Most recent activity'), str) else ''
+
+        topic = sanitize_text(extract_topic(tags_raw, collections), max_len=120)
+        doc_type = row['document_type']
+
+        content = row['fulltext']
+        if not content:
+            # Fallback to long or short summary
+            long_summary = row.get('Long summary')
+            short_summary = row.get('Short summary')
+            content = (long_summary if isinstance(long_summary, str) and long_summary.strip() else '')
+            if not content:
+                content = (short_summary if isinstance(short_summary, str) and short_summary.strip() else '')
+
+        # Clean and truncate content to avoid multiline CSV cells
+        content = sanitize_text(content, max_len=1500)
+
+        # content is already single-space separated, so spaces + 1 is the exact word count
+        doc_len = content.count(' ') + 1 if content else 0
+        if len(content) >= MIN_ANALYSIS_CHARS:
+            sentiment_label, sentiment_score = compute_sentiment(content, _get_analyzer())
+            language = detect_language(content)
+        else:
+            # Too short for a meaningful signal; skip the analyzers entirely
+            sentiment_label, sentiment_score, language = 'neutral', 0.0, ''
+        conf = compute_confidence(row)
+
+        return {
+            'id': doc_id_int,
+            'title': title or '',
+            'authority': authority or '',
+            'country': row['country'],
+            'region': row['region'],
+            'topic': topic or '',
+            'document_type': doc_type or '',
+            'date': row['date'],
+            'year': row['year'],
+            'month': row['month'],
+            'sentiment': sentiment_label,
+            'sentiment_score': round(float(sentiment_score), 4),
+            'risk_level': row['risk_level'],
+            'risk_score': round(float(row['risk_score']), 4),
+            'document_length': int(doc_len),
+            'confidence_score': round(float(conf), 3),
+            'status': status or '',
+            'content': content or '',
+            'url': url or '',
+            'language': language or '',
+            'tags': row['tags']
+        }
+    except Exception as e:
+        # Continue processing, but log error
+        sys.stderr.write(f"Error processing row {idx}: {e}\n")
+        return None
+
+
+def input_hash() -> str:
+    """Content hash of every input (and this script) that affects the output."""
+    h = hashlib.blake2b(digest_size=8)
+    for path in (DOCS_PATH, AUTH_PATH, os.path.abspath(__file__)):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    # Fulltext files are keyed by their listing; contents are read later anyway
+    for doc_id, path in sorted(fulltext_index().items()):
+        st = os.stat(path)
+        h.update(f'{doc_id}:{st.st_size}:{st.st_mtime_ns};'.encode())
+    return h.hexdigest()
+
+
+def write_cached_output(cache_path: str) -> int:
+    """Write OUT_PATH straight from a cached parquet copy; returns the row count."""
+    out = pd.read_parquet(cache_path)
+    with open(OUT_PATH, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(REQUIRED_COLUMNS)
+        writer.writerows(out[REQUIRED_COLUMNS].itertuples(index=False, name=None))
+    return len(out)
 
 
 def main():
+    # Reruns on unchanged inputs skip all feature work (parquet needs pyarrow)
+    cache_path = os.path.join(CACHE_DIR, f'{input_hash()}.parquet') if PYARROW_AVAILABLE else None
+    if cache_path and os.path.exists(cache_path):
+        print(f'Inputs unchanged; using cached {cache_path}')
+        print(f'Done. Wrote {write_cached_output(cache_path)} rows.')
+        return
+
     print('Loading CSVs...')
     docs = read_csv_safe(DOCS_PATH)
-    auth = read_csv_safe(AUTH_PATH)
+    auth = read_csv_as_dicts(AUTH_PATH)
     # Ensure expected columns exist
     for col in ['Name', 'Jurisdiction', 'Parent authority']:
-        if col not in auth.columns:
+        if not auth or col not in auth[0]:
             raise ValueError(f'Missing column in authorities.csv: {col}')
 
     # Prepare risk and harms columns from documents header
     risk_cols = [c for c in docs.columns if c.lower().startswith('risk factors')]
     harm_cols = [c for c in docs.columns if c.lower().startswith('harms')]
 
+    # Column-wise features are computed up front and carried in each record
+    docs = docs.join(normalize_dates(docs)).join(compute_risks(docs, risk_cols, harm_cols))
+    docs = docs.join(authority_country_region(docs['Authority'], auth))
+    docs['title'] = build_titles(docs)
+    docs['document_type'] = infer_doc_types(docs['title'], docs['Collections'])
+    docs['tags'] = normalize_tags(docs['Tags'])
+    docs['fulltext'] = prefetch_fulltexts(docs['AGORA ID'])
+
+    # Sort by id up front so results can be streamed out already in order
+    docs = docs.sort_values('AGORA ID', key=lambda s: pd.to_numeric(s, errors='coerce'), kind='stable')
+
+    # Rows are independent, so shard them across worker processes. Heavy
+    # read-only state is built once here and handed to the workers.
+    records = enumerate(docs.to_dict(orient='records'))
     analyzer = SentimentIntensityAnalyzer()
+    init_langdetect_profiles()
 
-    rows = []
+    written = 0
     total = len(docs)
-    for idx, row in docs.iterrows():
-        try:
-            doc_id = row.get('AGORA ID')
-            if pd.isna(doc_id):
-                continue
-            try:
-                doc_id_int = int(doc_id)
-            except Exception:
-                # some IDs may be strings; attempt to coerce
-                doc_id_int = int(str(doc_id).strip())
-
-            official_name = row.get('Official name')
-            casual_name = row.get('Casual name')
-            title_raw = official_name if isinstance(official_name, str) and official_name.strip() else casual_name
-            title = sanitize_text(title_raw or '', max_len=300)
-            authority = row.get('Authority') if isinstance(row.get('Authority'), str) else ''
-            url = choose_best_url(row)
-            collections = row.get('Collections') if isinstance(row.get('Collections'), str) else ''
-            tags_raw = row.get('Tags') if isinstance(row.get('Tags'), str) else ''
-            tags = normalize_tags(tags_raw)
-            status = row.get('Most recent activity') if isinstance(row.get('Most recent activity'), str) else ''
-
-            date_iso, year, month = normalize_date(row)
-            topic = sanitize_text(extract_topic(tags_raw, collections), max_len=120)
-            doc_type = infer_doc_type(title or '', collections)
-
-            content = load_fulltext(doc_id_int)
-            if not content:
-                # Fallback to long or short summary
-                long_summary = row.get('Long summary')
-                short_summary = row.get('Short summary')
-                content = (long_summary if isinstance(long_summary, str) and long_summary.strip() else '')
-                if not content:
-                    content = (short_summary if isinstance(short_summary, str) and short_summary.strip() else '')
-
-            # Clean and truncate content to avoid multiline CSV cells
-            content = sanitize_text(content, max_len=1500)
-
-            doc_len = len(content.split()) if content else 0
-            sentiment_label, sentiment_score = compute_sentiment(content, analyzer)
-            risk_level, risk_score = compute_risk(row, risk_cols, harm_cols)
-            conf = compute_confidence(row)
-            country, region = authority_country_region(authority, auth)
-            language = detect_language(content)
-
-            out = {
-                'id': doc_id_int,
-                'title': title or '',
-                'authority': authority or '',
-                'country': country or '',
-                'region': region or '',
-                'topic': topic or '',
-                'document_type': doc_type or '',
-                'date': date_iso or '',
-                'year': int(year) if year else '',
-                'month': int(month) if month else '',
-                'sentiment': sentiment_label,
-                'sentiment_score': round(float(sentiment_score), 4),
-                'risk_level': risk_level,
-                'risk_score': round(float(risk_score), 4),
-                'document_length': int(doc_len),
-                'confidence_score': round(float(conf), 3),
-                'status': status or '',
-                'content': content or '',
-                'url': url or '',
-                'language': language or '',
-                'tags': tags or ''
-            }
-            rows.append(out)
-        except Exception as e:
-            # Continue processing, but log error
-            sys.stderr.write(f"Error processing row {idx}: {e}\n")
-            continue
-        if (idx + 1) % 250 == 0:
-            print(f"Processed {idx + 1}/{total}...", flush=True)
-
-    print(f"Writing {len(rows)} rows to {OUT_PATH} ...")
-    # Write CSV with explicit column order
-    df_out = pd.DataFrame(rows, columns=REQUIRED_COLUMNS)
-    # Ensure id is integer and sort ascending
-    df_out['id'] = pd.to_numeric(df_out['id'], errors='coerce').astype('Int64')
-    df_out = df_out.sort_values('id').reset_index(drop=True)
-    df_out.to_csv(OUT_PATH, index=False, encoding='utf-8')
-    print('Done.')
+    print(f"Writing rows to {OUT_PATH} ...")
+    with Pool(cpu_count(), initializer=_init_worker, initargs=(analyzer,)) as pool, open(OUT_PATH, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=REQUIRED_COLUMNS, lineterminator=os.linesep)
+        writer.writeheader()
+        # imap (not imap_unordered) keeps the id order established above
+        for done, out in enumerate(pool.imap(process_row, records, chunksize=64), start=1):
+            if out is not None:
+                writer.writerow(out)
+                written += 1
+            if done % 250 == 0:
+                print(f"Processed {done}/{total}...", flush=True)
+    if cache_path:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Re-read as plain strings so a cache hit reproduces the CSV byte for byte
+        pd.read_csv(OUT_PATH, dtype=str, keep_default_na=False).to_parquet(cache_path, index=False)
+    print(f'Done. Wrote {written} rows.')
 
 
 if __name__ == '__main__':
@@ -5,19 +5,255 @@ Provides natural language querying and analysis of AI regulation data
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import os
+import re
+import hashlib
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: Polars' multi-threaded CSV reader for loading the dataset
+try:
+    import polars as pl
+    import polars.selectors as cs
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+# Optional: pyarrow, needed to cache the preprocessed frame as Parquet
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional: Numba JIT for the fused groupby mean/count kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Preprocessed frames are cached here as Parquet, keyed by the source CSV
+DATAFRAME_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".dataframe_cache")
+
+# Dataset columns the assistant reads; the rest (urls, tags, derived scores)
+# are never loaded
+DATASET_COLUMNS = (
+    "id", "title", "authority", "country", "region", "topic", "document_type",
+    "date", "status", "sentiment", "sentiment_score", "risk_level", "content",
+)
+
+# Filters honoured by query_data, in cache-key order
+FILTER_KEYS = ("date_from", "date_to", "country", "region")
+
+# Memoized query_data results kept per assistant
+QUERY_CACHE_SIZE = 128
+
+# dataset_exploration query types, all precomputed at load time
+EXPLORATION_TYPES = ("authorities", "countries", "document_types", "regions", "total_documents")
+
+# year_month_key of undated rows: the largest key, so they sort after every
+# month the way the "NaT" label did when grouping on strings
+NAT_MONTH_KEY = np.iinfo(np.int64).max
+
+
+def _read_dataset(path: str) -> pd.DataFrame:
+    """Read the used columns of the dataset CSV, lazily through Polars when installed"""
+    if not POLARS_AVAILABLE:
+        return pd.read_csv(path, usecols=lambda col: col in DATASET_COLUMNS)
+    # Projection is pushed into the scan, so unused columns are never materialized
+    lazy = pl.scan_csv(path, infer_schema_length=None).select(cs.by_name(*DATASET_COLUMNS, require_all=False))
+    df = lazy.collect().to_pandas()
+    # Polars hands missing strings over as None; pandas' reader uses NaN
+    text_cols = df.select_dtypes(object).columns
+    df[text_cols] = df[text_cols].fillna(np.nan)
+    return df
+
+
+def _value_counts(values: pd.Series) -> pd.Series:
+    """value_counts for a categorical via bincount on its codes, ordered like the object-dtype result"""
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return values.value_counts()
+    codes = values.cat.codes.to_numpy()
+    codes = codes[codes >= 0]
+    counts = np.bincount(codes, minlength=len(values.cat.categories))
+    # Observed categories in first-appearance order (dropping unobserved ones),
+    # so ties rank the same way they did before the categorical conversion
+    observed = pd.unique(codes)
+    return pd.Series(counts[observed], index=values.cat.categories[observed], name="count").sort_values(ascending=False)
+
+
+def _contains_mask(values: pd.Series, pattern: str) -> np.ndarray:
+    """Case-insensitive str.contains; categoricals test each category once and match by code"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        matching = np.flatnonzero(values.cat.categories.str.contains(pattern, case=False, na=False))
+        return np.isin(values.cat.codes.to_numpy(), matching)
+    return values.str.contains(pattern, case=False, na=False).to_numpy(dtype=bool)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _group_sums_jit(codes, values, n_groups):
+        sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        rows = np.zeros(n_groups, dtype=np.int64)
+        for i in range(codes.shape[0]):
+            code = codes[i]
+            rows[code] += 1
+            if not np.isnan(values[i]):
+                sums[code] += values[i]
+                counts[code] += 1
+        return sums, counts, rows
+
+
+def _group_mean_count(keys: pd.Series, values: pd.Series) -> pd.DataFrame:
+    """
+    NaN-skipping mean of values and row count per observed category of keys,
+    computed in a single pass over the data
+    
+    Returns:
+        DataFrame with "mean" and "count" columns, indexed by category in
+        category order (the order groupby(observed=True) produces)
+    """
+    codes = keys.cat.codes.to_numpy().astype(np.intp)
+    values = values.to_numpy(np.float64)
+    # Missing keys (code -1) form no group, as in groupby
+    if (codes < 0).any():
+        keep = codes >= 0
+        codes, values = codes[keep], values[keep]
+    
+    categories = keys.cat.categories
+    if NUMBA_AVAILABLE:
+        sums, counts, rows = _group_sums_jit(codes, values, len(categories))
+    else:
+        valid = ~np.isnan(values)
+        sums = np.bincount(codes[valid], weights=values[valid], minlength=len(categories))
+        counts = np.bincount(codes[valid], minlength=len(categories))
+        rows = np.bincount(codes, minlength=len(categories))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, sums / counts, np.nan)
+    
+    observed = rows > 0
+    return pd.DataFrame(
+        {"mean": means[observed], "count": rows[observed]},
+        index=categories[observed].rename(keys.name)
+    )
+
+
+def _year_month_labels(keys: np.ndarray) -> List[str]:
+    """Format year_month_key values (months since 1970-01) as "YYYY-MM" labels"""
+    return ["NaT" if key == NAT_MONTH_KEY else f"{1970 + key // 12:04d}-{key % 12 + 1:02d}" for key in keys]
+
+
+def _sentiment_mask(df: pd.DataFrame, sentiment: str) -> Optional[np.ndarray]:
+    """Rows with a clearly positive/negative score (label when there are no scores); None for other values"""
+    if sentiment not in ("positive", "negative"):
+        return None
+    if "sentiment_score" in df.columns:
+        scores = df["sentiment_score"].to_numpy()
+        return scores > 0.5 if sentiment == "positive" else scores < -0.5
+    return (df["sentiment"] == sentiment).to_numpy()
+
+
+# retrieve_documents filters: name -> builder of a boolean row mask for a filter value
+RETRIEVAL_FILTERS = {
+    "country": lambda df, value: _contains_mask(df["country"], value),
+    "authority": lambda df, value: _contains_mask(df["authority"], value),
+    "sentiment": _sentiment_mask,
+    "year": lambda df, value: (df["year"] == int(value)).to_numpy(),
+    "topic": lambda df, value: _contains_mask(df["topic"], value),
+}
+
+
+def _keyword_pattern(*keywords: str) -> re.Pattern:
+    """Compile keywords into one alternation, matched as plain substrings"""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
 
 class IntelligentAssistant:
     """AI Assistant that can query and analyze the dataset"""
     
+    # natural_language_query keyword groups, each searched in a single regex
+    # scan instead of one substring test per keyword
+    _EXPLORE_AUTHORITIES_RE = _keyword_pattern("what authorities", "list authorities", "which authorities", "authorities are")
+    _EXPLORE_COUNTRIES_RE = _keyword_pattern("what countries", "which countries", "countries are", "list countries")
+    _EXPLORE_DOCUMENT_TYPES_RE = _keyword_pattern("document types", "types of documents", "what types")
+    _EXPLORE_REGIONS_RE = _keyword_pattern("what regions", "which regions", "regions are")
+    _EXPLORE_TOTAL_RE = _keyword_pattern("how many documents", "total documents", "number of documents")
+    _RETRIEVAL_VERBS_RE = _keyword_pattern("show me", "give me", "find", "retrieve", "get")
+    _RETRIEVAL_NOUNS_RE = _keyword_pattern("document", "report", "summary")
+    _SENTIMENT_RE = _keyword_pattern("sentiment", "positive", "negative", "opinion")
+    _COUNTRY_RE = _keyword_pattern("country", "countries", "nation")
+    _REGION_RE = _keyword_pattern("region", "regional")
+    _TREND_OVER_TIME_RE = _keyword_pattern("trend", "over time")
+    _AUTHORITY_RE = _keyword_pattern("authority", "authorities", "organization", "who")
+    _RANKING_RE = _keyword_pattern("most", "top", "active", "leading")
+    _TREND_RE = _keyword_pattern("trend", "over time", "growth", "increase", "decrease")
+    _RISK_RE = _keyword_pattern("risk", "danger", "threat", "concern")
+    _TOPIC_RE = _keyword_pattern("topic", "theme", "subject", "about", "tags")
+    _RECENT_RE = _keyword_pattern("recent", "latest", "new", "current")
+    
     def __init__(self, data_path: str):
         """Initialize the assistant with dataset"""
-        self.df = pd.read_csv(data_path)
+        self.data_path = data_path
+        self._load_data()
+        
+        # NumPy views of the filterable columns so query_data can build masks
+        # without pandas alignment overhead
+        self._filter_arrays = {
+            "date": self.df["date"].to_numpy(),
+            "country": self.df["country"].to_numpy(),
+            "region": self.df["region"].to_numpy(),
+        }
+        
+        # The data is read-only after load, so results stay valid for the
+        # lifetime of the instance
+        self._query_cache = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._run_query)
+        # GroupBy objects over the unfiltered frame, by column (see _groupby)
+        self._groupby_cache = {}
+        # Exploration answers depend on nothing but the data, so compute them
+        # once, side by side since they are independent of each other
+        with ThreadPoolExecutor(max_workers=min(len(EXPLORATION_TYPES), os.cpu_count() or 1)) as pool:
+            self._exploration_results = dict(zip(EXPLORATION_TYPES, pool.map(self._explore_dataset, EXPLORATION_TYPES)))
+        
+    def _load_data(self):
+        """Load and preprocess the dataset, reusing a cached Parquet copy when the CSV is unchanged"""
+        cache_path = self._dataframe_cache_path() if PYARROW_AVAILABLE else None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                self.df = pd.read_parquet(cache_path, engine="pyarrow")
+                # Parquet hands missing strings back as None; keep pandas' NaN
+                text_cols = self.df.select_dtypes(object).columns
+                self.df[text_cols] = self.df[text_cols].fillna(np.nan)
+                return
+            except Exception as e:
+                print(f"⚠️  Could not read cached dataset ({e}); reloading CSV")
+        
+        self.df = _read_dataset(self.data_path)
         self.df["date"] = pd.to_datetime(self.df["date"], errors="coerce")
         self._preprocess_data()
         
+        if cache_path:
+            try:
+                os.makedirs(DATAFRAME_CACHE_DIR, exist_ok=True)
+                # Write then rename so a concurrent reader never sees a partial file
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                self.df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                print(f"⚠️  Could not cache preprocessed dataset: {e}")
+    
+    def _dataframe_cache_path(self) -> str:
+        """Parquet cache file for the current CSV (by size and mtime) and preprocessing code"""
+        stat = os.stat(self.data_path)
+        digest = hashlib.sha256(f"{os.path.abspath(self.data_path)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        # Changes to the preprocessing in this module must invalidate old caches
+        with open(os.path.abspath(__file__), "rb") as f:
+            digest.update(f.read())
+        return os.path.join(DATAFRAME_CACHE_DIR, f"{digest.hexdigest()[:16]}.parquet")
+    
     def _preprocess_data(self):
         """Preprocess data for efficient querying"""
         # Fill NaN values
@@ -25,10 +261,27 @@ class IntelligentAssistant:
             if col in self.df.columns:
                 self.df[col] = self.df[col].fillna("Unknown")
         
-        # Create time-based columns
-        self.df["year"] = self.df["date"].dt.year
-        self.df["month"] = self.df["date"].dt.month
-        self.df["quarter"] = self.df["date"].dt.quarter
+        # Low-cardinality columns as categoricals: int codes make groupby and
+        # value_counts cheaper and cut memory
+        for col in ["country", "region", "topic", "authority", "document_type", "status", "risk_level"]:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype("category")
+        
+        # Create time-based columns, all derived from one months-since-1970
+        # view of the date column instead of three .dt traversals
+        months = self.df["date"].to_numpy().astype("datetime64[M]")
+        undated = np.isnat(months)
+        month_index = months.astype(np.int64)
+        year = month_index // 12 + 1970
+        month = month_index % 12 + 1
+        quarter = (month - 1) // 3 + 1
+        # Same dtypes as the .dt accessors: int32, or float64 with NaN for NaT
+        for col, values in (("year", year), ("month", month), ("quarter", quarter)):
+            self.df[col] = np.where(undated, np.nan, values) if undated.any() else values.astype(np.int32)
+        
+        # Integer year-month key so monthly grouping takes pandas' int64 path
+        # instead of formatting and hashing a string per row
+        self.df["year_month_key"] = np.where(undated, NAT_MONTH_KEY, month_index)
         
     def query_data(self, query_type: str, filters: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -41,18 +294,18 @@ class IntelligentAssistant:
         Returns:
             Dictionary with query results and natural language explanation
         """
-        df = self.df.copy()
-        
-        # Apply filters
-        if filters:
-            if filters.get('date_from'):
-                df = df[df["date"] >= pd.to_datetime(filters['date_from'])]
-            if filters.get('date_to'):
-                df = df[df["date"] <= pd.to_datetime(filters['date_to'])]
-            if filters.get('country'):
-                df = df[df["country"] == filters['country']]
-            if filters.get('region'):
-                df = df[df["region"] == filters['region']]
+        return self._query_cache(query_type, self._filters_key(filters))
+    
+    @staticmethod
+    def _filters_key(filters: Optional[Dict] = None) -> Tuple:
+        """Hashable cache key for the filters that _apply_filters honours"""
+        if not filters:
+            return ()
+        return tuple(filters.get(name) or None for name in FILTER_KEYS)
+    
+    def _run_query(self, query_type: str, filters_key: Tuple) -> Dict[str, Any]:
+        """Uncached query_data body, taking the filters as a _filters_key tuple"""
+        df = self._apply_filters(dict(zip(FILTER_KEYS, filters_key)))
         
         # Execute query based on type
         if query_type == "sentiment_by_country":
@@ -74,15 +327,48 @@ class IntelligentAssistant:
         else:
             return {"error": "Unknown query type"}
     
+    def _apply_filters(self, filters: Optional[Dict] = None) -> pd.DataFrame:
+        """Return the rows matching the optional filters (self.df itself when unfiltered)"""
+        # Handlers only read df, so the unfiltered frame is shared without a copy
+        if not filters:
+            return self.df
+        
+        arrays = self._filter_arrays
+        masks = []
+        if filters.get('date_from'):
+            masks.append(arrays["date"] >= pd.to_datetime(filters['date_from']).to_datetime64())
+        if filters.get('date_to'):
+            masks.append(arrays["date"] <= pd.to_datetime(filters['date_to']).to_datetime64())
+        if filters.get('country'):
+            masks.append(arrays["country"] == filters['country'])
+        if filters.get('region'):
+            masks.append(arrays["region"] == filters['region'])
+        if not masks:
+            return self.df
+        
+        mask = np.logical_and.reduce(masks)
+        return self.df.iloc[np.flatnonzero(mask)]
+    
+    def _groupby(self, df: pd.DataFrame, col: str):
+        """
+        df.groupby(col, observed=True), reusing one GroupBy per column for the
+        unfiltered frame so its group codes are only computed once
+        
+        Filtered frames are per-query objects, so their groupbys aren't cached.
+        """
+        if df is not self.df:
+            return df.groupby(col, observed=True)
+        grouped = self._groupby_cache.get(col)
+        if grouped is None:
+            grouped = self._groupby_cache[col] = df.groupby(col, observed=True)
+        return grouped
+    
     def _sentiment_by_country(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze sentiment by country"""
         if "sentiment_score" not in df.columns:
             return {"error": "Sentiment data not available"}
         
-        sentiment_by_country = df.groupby("country").agg({
-            "sentiment_score": "mean",
-            "id": "count"
-        }).round(3)
+        sentiment_by_country = _group_mean_count(df["country"], df["sentiment_score"]).round(3)
         sentiment_by_country.columns = ["avg_sentiment", "document_count"]
         sentiment_by_country = sentiment_by_country.sort_values("avg_sentiment", ascending=False)
         
@@ -105,7 +391,7 @@ class IntelligentAssistant:
     
     def _top_authorities(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Find most active authorities"""
-        top_auth = df["authority"].value_counts().head(10)
+        top_auth = _value_counts(df["authority"]).head(10)
         
         most_active = top_auth.index[0]
         doc_count = top_auth.iloc[0]
@@ -121,8 +407,9 @@ class IntelligentAssistant:
     
     def _document_trends(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze document volume trends over time"""
-        df["year_month"] = df["date"].dt.to_period("M").astype(str)
-        trends = df.groupby("year_month").size()
+        trends = self._groupby(df, "year_month_key").size()
+        # Only the per-month totals need labels, not every row
+        trends.index = _year_month_labels(trends.index.to_numpy())
         
         avg_per_month = trends.mean()
         max_month = trends.idxmax()
@@ -152,7 +439,7 @@ class IntelligentAssistant:
         if "risk_level" not in df.columns:
             return {"error": "Risk level data not available"}
         
-        risk_dist = df["risk_level"].value_counts()
+        risk_dist = _value_counts(df["risk_level"])
         total = len(df)
         
         explanation = "Risk level distribution: "
@@ -177,12 +464,12 @@ class IntelligentAssistant:
         if "region" not in df.columns:
             return {"error": "Region data not available"}
         
-        region_stats = df.groupby("region").agg({
-            "id": "count",
-            "sentiment_score": "mean" if "sentiment_score" in df.columns else "count"
-        }).round(3)
-        
-        region_stats.columns = ["document_count", "avg_sentiment" if "sentiment_score" in df.columns else "metric"]
+        if "sentiment_score" in df.columns:
+            region_stats = _group_mean_count(df["region"], df["sentiment_score"])[["count", "mean"]].round(3)
+            region_stats.columns = ["document_count", "avg_sentiment"]
+        else:
+            region_stats = self._groupby(df, "region").agg({"id": "count", "sentiment_score": "count"}).round(3)
+            region_stats.columns = ["document_count", "metric"]
         region_stats = region_stats.sort_values("document_count", ascending=False)
         
         top_region = region_stats.index[0]
@@ -205,7 +492,7 @@ class IntelligentAssistant:
         if "topic" not in df.columns:
             return {"error": "Topic data not available"}
         
-        topics = df["topic"].value_counts().head(10)
+        topics = _value_counts(df["topic"]).head(10)
         
         explanation = f"The most discussed topic is '{topics.index[0]}' with {topics.iloc[0]} documents. "
         explanation += f"Top 10 topics cover {topics.sum()} documents."
@@ -218,8 +505,8 @@ class IntelligentAssistant:
     
     def _recent_activity(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Show recent activity"""
-        df_sorted = df.sort_values("date", ascending=False)
-        recent = df_sorted.head(10)
+        # Partial sort: only the 10 newest rows are ordered
+        recent = df.nlargest(10, "date")
         
         latest_date = recent["date"].max()
         countries = recent["country"].unique()
@@ -235,13 +522,15 @@ class IntelligentAssistant:
     
     def _summary_stats(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Get summary statistics"""
+        n = len(df)
+        date_min, date_max = df["date"].min(), df["date"].max()
         stats = {
-            "total_documents": len(df),
+            "total_documents": n,
             "countries": df["country"].nunique(),
             "authorities": df["authority"].nunique(),
             "date_range": {
-                "start": df["date"].min().strftime("%Y-%m-%d") if pd.notna(df["date"].min()) else None,
-                "end": df["date"].max().strftime("%Y-%m-%d") if pd.notna(df["date"].max()) else None
+                "start": date_min.strftime("%Y-%m-%d") if pd.notna(date_min) else None,
+                "end": date_max.strftime("%Y-%m-%d") if pd.notna(date_max) else None
             }
         }
         
@@ -262,8 +551,12 @@ class IntelligentAssistant:
     
     def dataset_exploration(self, query_type: str) -> Dict[str, Any]:
         """Explore dataset metadata and structure"""
+        return self._exploration_results.get(query_type) or {"error": "Unknown exploration query"}
+    
+    def _explore_dataset(self, query_type: str) -> Dict[str, Any]:
+        """Compute a dataset_exploration answer from the full dataset"""
         if query_type == "authorities":
-            authorities = self.df["authority"].value_counts()
+            authorities = _value_counts(self.df["authority"])
             explanation = f"The dataset contains {len(authorities)} unique authorities. "
             explanation += f"Top 5: {', '.join(authorities.head(5).index.tolist())}."
             return {
@@ -273,7 +566,7 @@ class IntelligentAssistant:
             }
         
         elif query_type == "countries":
-            countries = self.df["country"].value_counts()
+            countries = _value_counts(self.df["country"])
             explanation = f"The dataset covers {len(countries)} countries/regions. "
             explanation += f"Most represented: {', '.join(countries.head(5).index.tolist())}."
             return {
@@ -283,7 +576,7 @@ class IntelligentAssistant:
             }
         
         elif query_type == "document_types":
-            doc_types = self.df["document_type"].value_counts()
+            doc_types = _value_counts(self.df["document_type"])
             explanation = f"Document types include: {', '.join(doc_types.index.tolist())}. "
             explanation += f"Most common: {doc_types.index[0]} ({doc_types.iloc[0]} documents)."
             return {
@@ -292,7 +585,7 @@ class IntelligentAssistant:
             }
         
         elif query_type == "regions":
-            regions = self.df["region"].value_counts()
+            regions = _value_counts(self.df["region"])
             explanation = f"Regions covered: {', '.join(regions.index.tolist())}."
             return {
                 "data": regions.to_dict(),
@@ -312,50 +605,46 @@ class IntelligentAssistant:
     
     def retrieve_documents(self, filters: Dict[str, Any], limit: int = 5) -> Dict[str, Any]:
         """Retrieve specific documents based on filters"""
-        df = self.df.copy()
-        
-        # Apply filters
-        if filters.get("country"):
-            df = df[df["country"].str.contains(filters["country"], case=False, na=False)]
-        if filters.get("authority"):
-            df = df[df["authority"].str.contains(filters["authority"], case=False, na=False)]
-        if filters.get("sentiment"):
-            if filters["sentiment"] == "positive":
-                df = df[df["sentiment_score"] > 0.5] if "sentiment_score" in df.columns else df[df["sentiment"] == "positive"]
-            elif filters["sentiment"] == "negative":
-                df = df[df["sentiment_score"] < -0.5] if "sentiment_score" in df.columns else df[df["sentiment"] == "negative"]
-        if filters.get("year"):
-            df = df[df["year"] == int(filters["year"])]
-        if filters.get("topic"):
-            df = df[df["topic"].str.contains(filters["topic"], case=False, na=False)]
-        
-        # Sort by date (most recent first)
-        df = df.sort_values("date", ascending=False).head(limit)
-        
-        # Prepare results
-        results = []
-        for _, row in df.iterrows():
-            doc = {
-                "title": row.get("title", "Untitled"),
-                "authority": row.get("authority", "Unknown"),
-                "country": row.get("country", "Unknown"),
-                "date": row["date"].strftime("%Y-%m-%d") if pd.notna(row["date"]) else "Unknown",
-                "sentiment": row.get("sentiment", "Unknown"),
-                "content_preview": str(row.get("content", ""))[:200] + "..." if pd.notna(row.get("content")) else "No content available"
-            }
-            results.append(doc)
-        
-        explanation = f"Found {len(df)} documents matching your criteria. Showing top {len(results)}."
+        # Build every active filter's mask against the full frame and apply
+        # them in a single take, rather than one filtered copy per filter
+        masks = []
+        for name, build_mask in RETRIEVAL_FILTERS.items():
+            if filters.get(name):
+                mask = build_mask(self.df, filters[name])
+                if mask is not None:
+                    masks.append(mask)
+        df = self.df.iloc[np.flatnonzero(np.logical_and.reduce(masks))] if masks else self.df
+        
+        # Most recent first (a partial sort; undated rows still come last)
+        df = df.nlargest(limit, "date")
+        
+        # Prepare results column-wise rather than building a Series per row
+        if "content" in df.columns:
+            content = df["content"].dropna().astype(str)
+            previews = (content.str.slice(0, 200) + "...").reindex(df.index, fill_value="No content available")
+        else:
+            previews = "No content available"
+        results = pd.DataFrame({
+            "title": df.get("title", "Untitled"),
+            "authority": df.get("authority", "Unknown"),
+            "country": df.get("country", "Unknown"),
+            "date": df["date"].dt.strftime("%Y-%m-%d").fillna("Unknown"),
+            "sentiment": df.get("sentiment", "Unknown"),
+            "content_preview": previews
+        }, index=df.index).to_dict(orient="records")
+        
+        n = len(df)
+        explanation = f"Found {n} documents matching your criteria. Showing top {len(results)}."
         
         return {
             "data": results,
             "explanation": explanation,
-            "total_found": len(df)
+            "total_found": n
         }
     
     def compare_entities(self, entity1: str, entity2: str, entity_type: str = "country") -> Dict[str, Any]:
         """Compare two entities (countries, authorities, regions)"""
-        df = self.df.copy()
+        df = self.df
         
         if entity_type == "country":
             col = "country"
@@ -366,22 +655,24 @@ class IntelligentAssistant:
         else:
             return {"error": "Invalid entity type"}
         
-        # Filter for both entities
-        df1 = df[df[col].str.contains(entity1, case=False, na=False)]
-        df2 = df[df[col].str.contains(entity2, case=False, na=False)]
+        # Filter for both entities (matched against the column's categories,
+        # not every row)
+        df1 = df[_contains_mask(df[col], entity1)]
+        df2 = df[_contains_mask(df[col], entity2)]
         
+        n1, n2 = len(df1), len(df2)
         comparison = {
             entity1: {
-                "documents": len(df1),
+                "documents": n1,
                 "avg_sentiment": round(df1["sentiment_score"].mean(), 3) if "sentiment_score" in df1.columns else None,
                 "authorities": df1["authority"].nunique() if entity_type != "authority" else None,
-                "date_range": f"{df1['date'].min().strftime('%Y-%m-%d')} to {df1['date'].max().strftime('%Y-%m-%d')}" if len(df1) > 0 else None
+                "date_range": f"{df1['date'].min().strftime('%Y-%m-%d')} to {df1['date'].max().strftime('%Y-%m-%d')}" if n1 > 0 else None
             },
             entity2: {
-                "documents": len(df2),
+                "documents": n2,
                 "avg_sentiment": round(df2["sentiment_score"].mean(), 3) if "sentiment_score" in df2.columns else None,
                 "authorities": df2["authority"].nunique() if entity_type != "authority" else None,
-                "date_range": f"{df2['date'].min().strftime('%Y-%m-%d')} to {df2['date'].max().strftime('%Y-%m-%d')}" if len(df2) > 0 else None
+                "date_range": f"{df2['date'].min().strftime('%Y-%m-%d')} to {df2['date'].max().strftime('%Y-%m-%d')}" if n2 > 0 else None
             }
         }
         
@@ -411,19 +702,19 @@ class IntelligentAssistant:
         question_lower = question.lower()
         
         # Dataset exploration queries
-        if any(word in question_lower for word in ["what authorities", "list authorities", "which authorities", "authorities are"]):
+        if self._EXPLORE_AUTHORITIES_RE.search(question_lower):
             return self.dataset_exploration("authorities")
         
-        if any(word in question_lower for word in ["what countries", "which countries", "countries are", "list countries"]):
+        if self._EXPLORE_COUNTRIES_RE.search(question_lower):
             return self.dataset_exploration("countries")
         
-        if any(word in question_lower for word in ["document types", "types of documents", "what types"]):
+        if self._EXPLORE_DOCUMENT_TYPES_RE.search(question_lower):
             return self.dataset_exploration("document_types")
         
-        if any(word in question_lower for word in ["what regions", "which regions", "regions are"]):
+        if self._EXPLORE_REGIONS_RE.search(question_lower):
             return self.dataset_exploration("regions")
         
-        if any(word in question_lower for word in ["how many documents", "total documents", "number of documents"]):
+        if self._EXPLORE_TOTAL_RE.search(question_lower):
             return self.dataset_exploration("total_documents")
         
         # Comparison queries (US vs EU, etc.)
@@ -437,8 +728,8 @@ class IntelligentAssistant:
                 return self.query_data("compare_regions")
         
         # Document retrieval queries
-        if any(word in question_lower for word in ["show me", "give me", "find", "retrieve", "get"]) and \
-           any(word in question_lower for word in ["document", "report", "summary"]):
+        if self._RETRIEVAL_VERBS_RE.search(question_lower) and \
+           self._RETRIEVAL_NOUNS_RE.search(question_lower):
             filters = {}
             if "us" in question_lower or "united states" in question_lower:
                 filters["country"] = "United States"
@@ -456,33 +747,33 @@ class IntelligentAssistant:
             return self.retrieve_documents(filters)
         
         # Sentiment queries
-        if any(word in question_lower for word in ["sentiment", "positive", "negative", "opinion"]):
-            if any(word in question_lower for word in ["country", "countries", "nation"]):
+        if self._SENTIMENT_RE.search(question_lower):
+            if self._COUNTRY_RE.search(question_lower):
                 return self.query_data("sentiment_by_country")
-            elif any(word in question_lower for word in ["region", "regional"]):
+            elif self._REGION_RE.search(question_lower):
                 return self.query_data("compare_regions")
-            elif any(word in question_lower for word in ["trend", "over time"]):
+            elif self._TREND_OVER_TIME_RE.search(question_lower):
                 return self.query_data("document_trends")
         
         # Authority queries
-        if any(word in question_lower for word in ["authority", "authorities", "organization", "who"]):
-            if any(word in question_lower for word in ["most", "top", "active", "leading"]):
+        if self._AUTHORITY_RE.search(question_lower):
+            if self._RANKING_RE.search(question_lower):
                 return self.query_data("top_authorities")
         
         # Trend queries
-        if any(word in question_lower for word in ["trend", "over time", "growth", "increase", "decrease"]):
+        if self._TREND_RE.search(question_lower):
             return self.query_data("document_trends")
         
         # Risk queries
-        if any(word in question_lower for word in ["risk", "danger", "threat", "concern"]):
+        if self._RISK_RE.search(question_lower):
             return self.query_data("risk_analysis")
         
         # Topic queries
-        if any(word in question_lower for word in ["topic", "theme", "subject", "about", "tags"]):
+        if self._TOPIC_RE.search(question_lower):
             return self.query_data("topic_analysis")
         
         # Recent activity
-        if any(word in question_lower for word in ["recent", "latest", "new", "current"]):
+        if self._RECENT_RE.search(question_lower):
             return self.query_data("recent_activity")
         
         # Default to summary
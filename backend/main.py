@@ -1,15 +1,21 @@
-from fastapi import FastAPI, HTTPException, Query, UploadFile, File
+from fastapi import FastAPI, HTTPException, Query, Request, Response, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import os
+import asyncio
+import json
+import shutil
+import string
+import hashlib
+import threading
+from functools import lru_cache
 import nltk
-import tempfile
-import PyPDF2
-import docx
+import io
 
 # Configure NLTK data path
 nltk_data_path = os.path.expanduser('~/nltk_data')
@@ -19,17 +25,55 @@ if nltk_data_path not in nltk.data.path:
 # NLP imports
 from nltk.sentiment import SentimentIntensityAnalyzer
 from sklearn.feature_extraction.text import TfidfVectorizer
+from scipy.sparse import csr_matrix
 import pycountry
 
+# One VADER analyzer for the process: building it re-reads the lexicon from disk
+try:
+    SIA = SentimentIntensityAnalyzer()
+except Exception as e:
+    print(f"Warning: Sentiment analysis unavailable: {e}")
+    SIA = None
+
+# Optional: pyarrow, for the memory-mapped Arrow copy of the preprocessed dataset
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional: Polars lazy frames for the period pivots, switched on with USE_POLARS=1
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+USE_POLARS = POLARS_AVAILABLE and os.environ.get("USE_POLARS") == "1"
+
+# Optional: Numba JIT for summing TF-IDF rows of a date window
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional: orjson, for serializing responses in C
+try:
+    import orjson  # noqa: F401 (needed by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
+
 # Intelligent Assistant
-from intelligent_assistant import IntelligentAssistant
+from intelligent_assistant import IntelligentAssistant, _value_counts
 from hybrid_llm_assistant import HybridLLMAssistant
 
-app = FastAPI(title="AI Regulation Analytics API", version="1.0.0")
+app = FastAPI(title="AI Regulation Analytics API", version="1.0.0", default_response_class=DefaultResponse)
 
 # Initialize intelligent assistants
 assistant = None  # Original assistant
 hybrid_assistant = None  # Hybrid LLM assistant
+assistants_ready = threading.Event()  # Set once both have finished initializing (or failed)
 
 # CORS middleware
 app.add_middleware(
@@ -43,26 +87,326 @@ app.add_middleware(
 # Load data
 DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "agora", "clean_dataset.csv")
 df_global = None
+# Country name -> ISO 3166 alpha-3 code (None if unresolvable) for df_global's countries
+iso3_codes = {}
+# /api/filters response, fixed for the lifetime of df_global
+filter_options = None
+# (authority, country) pair code of each row of df_global, see _edge_codes
+edge_codes = None
+# Row positions of df_global ordered by date (NaT rows left out), and those dates
+date_order = None
+sorted_dates = None
+# Polars frame of the columns the period pivots and network/quarterly counts group on (only with USE_POLARS)
+pl_frame = None
+
+# Columns mirrored into pl_frame
+POLARS_COLUMNS = ["date", "year", "ym", "quarter", "sentiment", "risk_level", "authority", "country"]
+
+# Dataset columns no endpoint reads; they are never loaded
+UNUSED_COLUMNS = ("id", "url", "month")
+
+# Low-cardinality label columns, stored as categoricals so groupbys run on integer codes
+CATEGORICAL_COLUMNS = [
+    "country", "region", "topic", "authority", "document_type",
+    "sentiment", "risk_level", "language", "status", "year",
+]
+
+# Sentiment buckets for VADER compound scores, from most negative to most positive
+SENTIMENT_KEYS = ["highlyNegative", "negative", "slightlyNegative", "neutral",
+                  "slightlyPositive", "positive", "highlyPositive"]
+SENTIMENT_LABELS = np.array(["Highly Negative", "Negative", "Slightly Negative", "Neutral",
+                             "Slightly Positive", "Positive", "Highly Positive"])
+
+# The preprocessed dataset and its TF-IDF matrix are cached here, keyed by the source CSV.
+# Both are uncompressed and memory-mapped, so every worker process reading them shares one
+# copy of the numeric columns and matrix buffers through the OS page cache.
+DATA_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".dataframe_cache")
+
+def _data_cache_path(suffix: str) -> str:
+    """Cache file for the current CSV (by size and mtime) and this module's preprocessing"""
+    stat = os.stat(DATA_PATH)
+    digest = hashlib.sha256(f"{os.path.abspath(DATA_PATH)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    with open(os.path.abspath(__file__), "rb") as f:
+        digest.update(f.read())
+    return os.path.join(DATA_CACHE_DIR, f"api_{digest.hexdigest()[:16]}{suffix}")
+
+def _read_cached_data(cache_path: str) -> pd.DataFrame:
+    """Map the Arrow IPC copy of the preprocessed dataset; numeric columns stay zero-copy views of it"""
+    table = pa.ipc.open_file(pa.memory_map(cache_path, "r")).read_all()
+    # split_blocks keeps one block per column instead of consolidating (and copying) them
+    df = table.to_pandas(split_blocks=True)
+    # Arrow hands missing strings back as None; keep pandas' NaN
+    text_cols = df.select_dtypes(object).columns
+    df[text_cols] = df[text_cols].fillna(np.nan)
+    return df
+
+def _write_cached_data(df: pd.DataFrame, cache_path: str):
+    """Write df as an uncompressed Arrow IPC file, then rename so no worker maps a partial file"""
+    table = pa.Table.from_pandas(df)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, cache_path)
+
+def _vader_compound(texts: pd.Series) -> Optional[np.ndarray]:
+    """VADER compound score per text (NaN for empty text), or None if VADER is unavailable"""
+    if SIA is None:
+        return None
+    
+    # Score each distinct text once; repeated documents (and empty ones) reuse the result
+    codes, uniques = pd.factorize(texts)
+    unique_scores = np.fromiter(
+        (SIA.polarity_scores(text).get("compound", 0.0) if isinstance(text, str) and text else np.nan
+         for text in uniques),
+        dtype=np.float32, count=len(uniques),
+    )
+    # Code -1 (missing text) picks the trailing NaN
+    return np.append(unique_scores, np.float32(np.nan))[codes]
+
+def _sentiment_buckets(compound: np.ndarray) -> np.ndarray:
+    """Index into SENTIMENT_KEYS for each compound score; exactly ±0.2 and ±0.6 fall in the stronger bucket"""
+    magnitude = np.abs(compound)
+    steps = (magnitude > 0) + np.digitize(magnitude, [0.2, 0.6])
+    return 3 + np.sign(compound).astype(np.int64) * steps
+
+def _count_table(df: pd.DataFrame, index_col: str, columns_col: str) -> pd.DataFrame:
+    """Row counts per (index_col, columns_col) pair of two categoricals as a wide table.
+
+    Same result as groupby().size() pivoted and NaN-filled with 0, computed as one
+    bincount over the category codes: only observed labels, in label order, and
+    float counts whenever some cell is empty.
+    """
+    rows = df[index_col].cat.codes.to_numpy().astype(np.int64)
+    cols = df[columns_col].cat.codes.to_numpy().astype(np.int64)
+    row_labels = df[index_col].cat.categories
+    col_labels = df[columns_col].cat.categories
+    valid = (rows >= 0) & (cols >= 0)
+    
+    counts = np.bincount(rows[valid] * len(col_labels) + cols[valid], minlength=len(row_labels) * len(col_labels))
+    counts = counts.reshape(len(row_labels), len(col_labels))
+    observed_rows = counts.any(axis=1)
+    observed_cols = counts.any(axis=0)
+    counts = counts[observed_rows][:, observed_cols]
+    if (counts == 0).any():
+        counts = counts.astype(float)
+    
+    return pd.DataFrame(
+        counts,
+        index=pd.Index(row_labels[observed_rows], name=index_col),
+        columns=pd.Index(col_labels[observed_cols], name=columns_col),
+    )
+
+def _edge_codes(df: pd.DataFrame) -> np.ndarray:
+    """authority code * number of countries + country code for each row; -1 where either is missing or Unknown"""
+    authorities = df["authority"].cat.codes.to_numpy().astype(np.int64)
+    countries = df["country"].cat.codes.to_numpy().astype(np.int64)
+    known = (authorities >= 0) & (countries >= 0)
+    known &= (df["authority"] != "Unknown").to_numpy() & (df["country"] != "Unknown").to_numpy()
+    return np.where(known, authorities * len(df["country"].cat.categories) + countries, -1)
+
+def _records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """df.to_dict(orient="records"), built from one tolist() per column instead of boxing cell by cell"""
+    columns = df.columns.tolist()
+    return [dict(zip(columns, row)) for row in zip(*(df[col].tolist() for col in columns))]
+
+def _label_counts(values: pd.Series, name: str = "count") -> pd.DataFrame:
+    """groupby(values, observed=True).size().reset_index(name=name) for a categorical, as one
+    bincount over its codes: observed labels only, in label order"""
+    codes = values.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+    observed = np.flatnonzero(counts)
+    return pd.DataFrame({values.name: values.cat.categories[observed], name: counts[observed]})
+
+def _bin_counts(values: pd.Series, bins: List[float]) -> np.ndarray:
+    """Counts per bin with pd.cut(include_lowest=True) semantics: (a, b] bins, the first closed
+    on the left, and NaN or out-of-range values left out"""
+    values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    edges = np.asarray(bins, dtype=np.float64)
+    in_range = (values >= edges[0]) & (values <= edges[-1])
+    codes = np.maximum(np.searchsorted(edges, values[in_range], side="left") - 1, 0)
+    return np.bincount(codes, minlength=len(edges) - 1)
+
+def _prepare_data() -> pd.DataFrame:
+    """Parse the dataset CSV and derive the columns the endpoints use"""
+    df = pd.read_csv(DATA_PATH, usecols=lambda col: col not in UNUSED_COLUMNS)
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    df["year"] = df["date"].dt.year
+    df["ym"] = df["date"].dt.to_period("M").astype(str).astype("category")
+    df["quarter"] = df["date"].dt.to_period("Q").astype(str).astype("category")
+    
+    # Fill NaN
+    for col in ["country", "region", "topic", "authority", "document_type"]:
+        if col in df.columns:
+            df[col] = df[col].fillna("Unknown")
+    
+    df["text"] = df.get("content", df.get("title", "")).fillna("")
+    # Only "text" is read from here on; don't keep a second copy of every document
+    df = df.drop(columns=["content"], errors="ignore")
+    
+    # Score every document once here instead of per request
+    compound = _vader_compound(df["text"])
+    if compound is not None:
+        df["sentiment_compound"] = compound
+    
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
 
 def load_data():
-    global df_global
+    global df_global, iso3_codes, filter_options, pl_frame, edge_codes
     if df_global is None:
-        df = pd.read_csv(DATA_PATH)
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        df["year"] = df["date"].dt.year
-        df["month"] = df["date"].dt.month
-        df["ym"] = df["date"].dt.to_period("M").astype(str)
-        df["quarter"] = df["date"].dt.to_period("Q").astype(str)
+        for cache in _response_caches:
+            cache.cache_clear()
+        _date_slice.cache_clear()
+        
+        # Reuse the Arrow copy when the CSV is unchanged: no CSV tokenizing,
+        # date parsing, period formatting or sentiment scoring on startup
+        df = None
+        cache_path = _data_cache_path(".arrow") if PYARROW_AVAILABLE else None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                df = _read_cached_data(cache_path)
+            except Exception as e:
+                print(f"⚠️  Could not read cached dataset ({e}); reloading CSV")
         
-        # Fill NaN
-        for col in ["country", "region", "topic", "authority", "document_type"]:
-            if col in df.columns:
-                df[col] = df[col].fillna("Unknown")
+        if df is None:
+            df = _prepare_data()
+            # Without VADER scores, leave the cache alone so they get computed once VADER is available
+            if cache_path and "sentiment_compound" in df.columns:
+                try:
+                    os.makedirs(DATA_CACHE_DIR, exist_ok=True)
+                    _write_cached_data(df, cache_path)
+                except Exception as e:
+                    print(f"⚠️  Could not cache preprocessed dataset: {e}")
         
-        df["text"] = df.get("content", df.get("title", "")).fillna("")
+        _index_dates(df)
+        # Resolve every distinct country name once (pycountry's lookup is a fuzzy search)
+        iso3_codes = {name: to_iso3(name) for name in df["country"].cat.categories}
+        filter_options = _filter_options(df)
+        edge_codes = _edge_codes(df)
+        if USE_POLARS:
+            # Labels as plain strings, so Polars sorts pivot rows and columns the way the categories are ordered
+            columns = [col for col in POLARS_COLUMNS if col in df.columns]
+            pl_frame = pl.from_pandas(df[columns]).with_columns(pl.col(pl.Categorical).cast(pl.String))
         df_global = df
     return df_global
 
+def _filter_options(df: pd.DataFrame) -> Dict[str, Any]:
+    """Filter option lists and overall date range; the categories are exactly the distinct values"""
+    date_min = sorted_dates[0] if len(sorted_dates) else None
+    date_max = sorted_dates[-1] if len(sorted_dates) else None
+    return {
+        "countries": sorted(df["country"].cat.categories.tolist()),
+        "topics": sorted(df["topic"].cat.categories.tolist()) if "topic" in df.columns else [],
+        "authorities": sorted(df["authority"].cat.categories.tolist()),
+        "date_range": {
+            "min": pd.Timestamp(date_min).isoformat() if date_min is not None else None,
+            "max": pd.Timestamp(date_max).isoformat() if date_max is not None else None
+        }
+    }
+
+def _index_dates(df: pd.DataFrame):
+    """Sort the row positions of df by date once, dropping NaT rows"""
+    global date_order, sorted_dates
+    dates = df["date"].to_numpy()
+    valid = np.flatnonzero(~np.isnat(dates))
+    date_order = valid[np.argsort(dates[valid], kind="stable")]
+    sorted_dates = dates[date_order]
+
+def to_iso3(name):
+    """ISO 3166 alpha-3 code for a country name, or None if pycountry can't resolve it"""
+    try:
+        return pycountry.countries.lookup(name).alpha_3
+    except:
+        return None
+
+# Date windows whose parsed bounds and row positions are kept; a dashboard render asks for the same one from every chart
+DATE_SLICE_CACHE_SIZE = 64
+
+@lru_cache(maxsize=DATE_SLICE_CACHE_SIZE)
+def _parse_date(value) -> np.datetime64:
+    """Query date bound as datetime64[ns]; ISO dates take numpy's parser, anything else pandas'"""
+    try:
+        return np.datetime64(value, "ns")
+    except ValueError:
+        return pd.to_datetime(value).to_datetime64()
+
+@lru_cache(maxsize=DATE_SLICE_CACHE_SIZE)
+def _date_slice(date_from, date_to) -> np.ndarray:
+    """Row positions with date_from <= date <= date_to in dataset order (read-only, shared by callers)"""
+    lo = np.searchsorted(sorted_dates, _parse_date(date_from)) if date_from else 0
+    hi = np.searchsorted(sorted_dates, _parse_date(date_to), side="right") if date_to else len(sorted_dates)
+    # Back in dataset order, so head()/sample()/tie-breaking see the same rows a boolean mask would give
+    rows = np.sort(date_order[lo:hi])
+    rows.flags.writeable = False
+    return rows
+
+def date_positions(date_from=None, date_to=None) -> Optional[np.ndarray]:
+    """Row positions with date_from <= date <= date_to in dataset order, or None when unbounded"""
+    load_data()
+    if not date_from and not date_to:
+        return None
+    return _date_slice(date_from, date_to)
+
+def filter_by_date(date_from=None, date_to=None) -> pd.DataFrame:
+    """Rows of the dataset with date_from <= date <= date_to, found by binary search on the date index"""
+    rows = date_positions(date_from, date_to)
+    return df_global if rows is None else df_global.iloc[rows]
+
+def _polars_window(date_from, date_to):
+    """Lazy Polars query over the rows of pl_frame with date_from <= date <= date_to"""
+    lf = pl_frame.lazy()
+    if date_from:
+        lf = lf.filter(pl.col("date") >= pl.lit(_parse_date(date_from)))
+    if date_to:
+        lf = lf.filter(pl.col("date") <= pl.lit(_parse_date(date_to)))
+    return lf
+
+def _polars_count_table(date_from, date_to, index_col: str, columns_col: str, keep: Optional[List[str]] = None):
+    """_count_table(filter_by_date(...), index_col, columns_col).reset_index() as a lazy Polars query.
+
+    keep restricts columns_col to the given labels. Returns a Polars DataFrame with
+    the same rows, columns and int/float counts as the pandas version.
+    """
+    lf = _polars_window(date_from, date_to).filter(pl.col(index_col).is_not_null() & pl.col(columns_col).is_not_null())
+    if keep is not None:
+        lf = lf.filter(pl.col(columns_col).is_in(keep))
+    counts = lf.group_by([index_col, columns_col]).agg(pl.len().alias("count")).collect()
+    if counts.is_empty():
+        return pl.DataFrame(schema={index_col: pl.String})
+    
+    pivot = counts.pivot(on=columns_col, index=index_col, values="count", sort_columns=True).sort(index_col)
+    value_cols = pivot.columns[1:]
+    if pivot.select(pl.any_horizontal(pl.col(value_cols).is_null().any())).item():
+        # pandas fills the empty cells with NaN first, so the counts come back as floats
+        return pivot.with_columns(pl.col(value_cols).fill_null(0).cast(pl.Float64))
+    return pivot.with_columns(pl.col(value_cols).cast(pl.Int64))
+
+# Media type of Arrow IPC streams, served to clients that ask for it in Accept
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+def _data_response(request: Request, frame):
+    """{"data": records} of a pandas or Polars frame, or the frame as an Arrow IPC stream if accepted"""
+    is_pandas = isinstance(frame, pd.DataFrame)
+    if PYARROW_AVAILABLE and ARROW_STREAM in request.headers.get("accept", ""):
+        table = pa.Table.from_pandas(frame, preserve_index=False) if is_pandas else frame.to_arrow()
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return Response(content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM)
+    return {"data": _records(frame) if is_pandas else frame.to_dicts()}
+
+# Memoized endpoint computations, keyed on their query arguments
+RESPONSE_CACHE_SIZE = 256
+_response_caches = []
+
+def cached_response(func):
+    """Cache a pure function of the dataset and its arguments until the dataset reloads"""
+    cached = lru_cache(maxsize=RESPONSE_CACHE_SIZE)(func)
+    _response_caches.append(cached)
+    return cached
+
 # Pydantic models
 class FilterRequest(BaseModel):
     date_from: Optional[str] = None
@@ -74,48 +418,55 @@ class ChatRequest(BaseModel):
     query: str
     filters: Optional[Dict[str, Any]] = None
 
+def _init_assistants():
+    """Build both assistants; runs on a worker thread so startup doesn't wait for them"""
+    global assistant, hybrid_assistant
+    try:
+        # Initialize intelligent assistant
+        try:
+            assistant = IntelligentAssistant(DATA_PATH)
+        except Exception as e:
+            print(f"⚠️  Intelligent assistant initialization failed: {e}")
+        
+        # Initialize hybrid LLM assistant
+        # Supports: Gemini (free), OpenAI (paid), or rule-based (no API key)
+        # Configure via .env file or environment variables
+        try:
+            hybrid_assistant = HybridLLMAssistant(DATA_PATH)
+            print("✅ Hybrid LLM Assistant initialized successfully!")
+        except Exception as e:
+            print(f"⚠️  Hybrid assistant initialization failed: {e}")
+            print("   Falling back to basic assistant only")
+            hybrid_assistant = None
+    finally:
+        assistants_ready.set()
+
 @app.on_event("startup")
 async def startup_event():
-    global assistant, hybrid_assistant
     load_data()
-    # Initialize intelligent assistant
-    assistant = IntelligentAssistant(DATA_PATH)
-    
-    # Initialize hybrid LLM assistant
-    # Supports: Gemini (free), OpenAI (paid), or rule-based (no API key)
-    # Configure via .env file or environment variables
-    try:
-        hybrid_assistant = HybridLLMAssistant(DATA_PATH)
-        print("✅ Hybrid LLM Assistant initialized successfully!")
-    except Exception as e:
-        print(f"⚠️  Hybrid assistant initialization failed: {e}")
-        print("   Falling back to basic assistant only")
-        hybrid_assistant = None
+    # The dashboard endpoints are ready now; the assistants warm up in the background
+    asyncio.get_running_loop().run_in_executor(None, _init_assistants)
 
 @app.get("/")
 def root():
     return {"message": "AI Regulation Analytics API", "version": "1.0.0"}
 
-@app.get("/api/overview")
-def get_overview(
-    date_from: Optional[str] = Query(None),
-    date_to: Optional[str] = Query(None)
-):
+@app.get("/api/health")
+def health():
+    """Liveness plus whether the assistants have finished warming up"""
+    return {"status": "ok", "assistants_ready": assistants_ready.is_set()}
+
+@cached_response
+def _compute_overview(date_from: Optional[str], date_to: Optional[str]):
     """Get overview statistics"""
-    df_all = load_data().copy()
-    df = df_all.copy()
-    
     # Apply filters for current period
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     # Calculate previous period for comparison
     prev_stats = None
     if date_from and date_to:
-        date_from_dt = pd.to_datetime(date_from)
-        date_to_dt = pd.to_datetime(date_to)
+        date_from_dt = pd.Timestamp(_parse_date(date_from))
+        date_to_dt = pd.Timestamp(_parse_date(date_to))
         period_length = (date_to_dt - date_from_dt).days
         
         # Calculate previous period dates
@@ -123,10 +474,7 @@ def get_overview(
         prev_date_from = prev_date_to - pd.Timedelta(days=period_length)
         
         # Get previous period data
-        df_prev = df_all[
-            (df_all["date"] >= prev_date_from) & 
-            (df_all["date"] <= prev_date_to)
-        ]
+        df_prev = filter_by_date(prev_date_from, prev_date_to)
         
         if len(df_prev) > 0:
             prev_stats = {
@@ -135,21 +483,11 @@ def get_overview(
                 "num_countries": int(df_prev["country"].nunique())
             }
     
-    # Compute sentiment with VADER
+    # Average VADER sentiment, from the scores computed at load time
     avg_sentiment = 0.0
-    try:
-        sia = SentimentIntensityAnalyzer()
-        sentiments = []
-        for text in df["text"].head(100):  # Sample for speed
-            if isinstance(text, str) and text:
-                comp = sia.polarity_scores(text).get("compound", 0.0)
-                sentiments.append(comp)
-        
-        avg_sentiment = float(np.mean(sentiments)) if sentiments else 0.0
-    except Exception as e:
-        print(f"Warning: Sentiment analysis failed: {e}")
-        # Use a simple fallback sentiment calculation
-        avg_sentiment = 0.0
+    if "sentiment_compound" in df.columns:
+        mean_compound = df["sentiment_compound"].mean()
+        avg_sentiment = float(mean_compound) if pd.notna(mean_compound) else 0.0
     
     # Calculate changes
     current_stats = {
@@ -179,69 +517,53 @@ def get_overview(
         }
     }
 
-@app.get("/api/document-volume")
-def get_document_volume(
+@app.get("/api/overview")
+def get_overview(
     date_from: Optional[str] = Query(None),
-    date_to: Optional[str] = Query(None),
-    period: str = Query("month")
+    date_to: Optional[str] = Query(None)
 ):
+    """Get overview statistics"""
+    return _compute_overview(date_from, date_to)
+
+@cached_response
+def _compute_document_volume(date_from: Optional[str], date_to: Optional[str], period: str):
     """Get document volume over time"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     time_col = "ym" if period == "month" else "quarter"
-    volume = df.groupby(time_col).size().reset_index(name="count")
+    volume = _label_counts(df[time_col], "count")
     
     return {
-        "data": volume.to_dict(orient="records")
+        "data": _records(volume)
     }
 
+@app.get("/api/document-volume")
+def get_document_volume(
+    date_from: Optional[str] = Query(None),
+    date_to: Optional[str] = Query(None),
+    period: str = Query("month")
+):
+    """Get document volume over time"""
+    return _compute_document_volume(date_from, date_to, period)
+
 @app.get("/api/sentiment-distribution")
 def get_sentiment_distribution(
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None)
 ):
     """Get sentiment distribution"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     # Use existing sentiment column if available
     if "sentiment" in df.columns:
-        sentiment_counts = df["sentiment"].value_counts().to_dict()
+        sentiment_counts = _value_counts(df["sentiment"]).to_dict()
         return {
             "data": [{"sentiment": k, "count": int(v)} for k, v in sentiment_counts.items()]
         }
     
-    # Fallback to VADER sentiment
-    sia = SentimentIntensityAnalyzer()
-    labels = []
-    for text in df["text"].head(1000):
-        if isinstance(text, str) and text:
-            comp = sia.polarity_scores(text).get("compound", 0.0)
-            if comp >= 0.6:
-                labels.append("Highly Positive")
-            elif comp >= 0.2:
-                labels.append("Positive")
-            elif comp > 0:
-                labels.append("Slightly Positive")
-            elif comp == 0:
-                labels.append("Neutral")
-            elif comp > -0.2:
-                labels.append("Slightly Negative")
-            elif comp > -0.6:
-                labels.append("Negative")
-            else:
-                labels.append("Highly Negative")
-        else:
-            labels.append("Neutral")
+    # Fallback to VADER sentiment (documents without text count as neutral)
+    compound = df["sentiment_compound"].to_numpy() if "sentiment_compound" in df.columns else np.zeros(len(df))
+    labels = SENTIMENT_LABELS[_sentiment_buckets(np.nan_to_num(compound, nan=0.0))]
     
     sentiment_counts = pd.Series(labels).value_counts().to_dict()
     
@@ -256,25 +578,12 @@ def get_sentiment_trend(
     period: str = Query("month")
 ):
     """Get sentiment trend over time by sentiment category"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     time_col = "ym" if period == "month" else "quarter"
     
     # Use sentiment column if available
     if "sentiment" in df.columns:
-        # Group by time period and sentiment
-        sentiment_counts = df.groupby([time_col, "sentiment"]).size().reset_index(name="count")
-        
-        # Pivot to get sentiments as columns
-        pivot = sentiment_counts.pivot(index=time_col, columns="sentiment", values="count").fillna(0)
-        pivot = pivot.reset_index()
-        pivot.columns.name = None
-        
         # Rename columns to match expected format
         column_mapping = {
             "highly negative": "highlyNegative",
@@ -286,6 +595,15 @@ def get_sentiment_trend(
             "highly positive": "highlyPositive"
         }
         
+        if USE_POLARS:
+            pivot = _polars_count_table(date_from, date_to, time_col, "sentiment")
+            pivot = pivot.rename({col: column_mapping.get(col, col) for col in pivot.columns})
+            return {"data": pivot.rename({time_col: "period"}).to_dicts()}
+        
+        # Count by time period and sentiment, with sentiments as columns
+        pivot = _count_table(df, time_col, "sentiment").reset_index()
+        pivot.columns.name = None
+        
         for old_col, new_col in column_mapping.items():
             if old_col in pivot.columns:
                 pivot.rename(columns={old_col: new_col}, inplace=True)
@@ -293,48 +611,106 @@ def get_sentiment_trend(
         # Rename time column to 'period'
         pivot.rename(columns={time_col: "period"}, inplace=True)
         
-        return {"data": pivot.to_dict(orient="records")}
-    
-    # Fallback to VADER
-    df_sample = df.sample(min(1000, len(df)))
-    
-    sia = SentimentIntensityAnalyzer()
-    results = []
-    
-    for _, row in df_sample.iterrows():
-        text = row.get("text", "")
-        if isinstance(text, str) and text:
-            comp = sia.polarity_scores(text).get("compound", 0.0)
-            period = row[time_col]
-            
-            # Categorize sentiment
-            if comp <= -0.6:
-                sentiment = "highlyNegative"
-            elif comp <= -0.2:
-                sentiment = "negative"
-            elif comp < 0:
-                sentiment = "slightlyNegative"
-            elif comp == 0:
-                sentiment = "neutral"
-            elif comp < 0.2:
-                sentiment = "slightlyPositive"
-            elif comp < 0.6:
-                sentiment = "positive"
-            else:
-                sentiment = "highlyPositive"
-            
-            results.append({"period": period, "sentiment": sentiment})
-    
-    result_df = pd.DataFrame(results)
-    sentiment_counts = result_df.groupby(["period", "sentiment"]).size().reset_index(name="count")
-    pivot = sentiment_counts.pivot(index="period", columns="sentiment", values="count").fillna(0)
-    pivot = pivot.reset_index()
+        return {"data": _records(pivot)}
+    
+    # Fallback to VADER scores of a random sample of up to 1000 documents
+    sample = np.random.choice(len(df), size=min(1000, len(df)), replace=False)
+    compound = df["sentiment_compound"].to_numpy()[sample] if "sentiment_compound" in df.columns else np.empty(0)
+    scored = ~np.isnan(compound)
+    periods = df[time_col].cat.codes.to_numpy()[sample][scored]
+    
+    sentiment_keys = sorted(SENTIMENT_KEYS)
+    sentiment_codes = np.searchsorted(sentiment_keys, np.array(SENTIMENT_KEYS)[_sentiment_buckets(compound[scored])])
+    counts = pd.DataFrame({
+        "period": pd.Categorical.from_codes(periods, df[time_col].cat.categories),
+        "sentiment": pd.Categorical.from_codes(sentiment_codes, sentiment_keys),
+    })
+    pivot = _count_table(counts, "period", "sentiment").reset_index()
     pivot.columns.name = None
     
     return {
-        "data": pivot.to_dict(orient="records")
+        "data": _records(pivot)
     }
 
+TFIDF_ARRAYS = ("data", "indices", "indptr", "terms")
+
+@cached_response
+def _tfidf_index():
+    """TF-IDF matrix (CSR, one row per document) and terms, fitted once on the whole corpus"""
+    df = load_data()
+    cache_dir = _data_cache_path(".tfidf")
+    unreadable = False
+    if os.path.isdir(cache_dir):
+        try:
+            # Memory-mapped .npy arrays, shared between workers like the dataset itself
+            data, indices, indptr, terms = (np.load(os.path.join(cache_dir, f"{name}.npy"), mmap_mode="r")
+                                            for name in TFIDF_ARRAYS)
+            return csr_matrix((data, indices, indptr), shape=(len(df), len(terms)), copy=False), terms
+        except Exception as e:
+            print(f"⚠️  Could not read cached TF-IDF matrix ({e}); refitting")
+            unreadable = True
+    
+    vectorizer = TfidfVectorizer(
+        stop_words='english',
+        max_df=0.85,
+        min_df=2,
+        ngram_range=(1, 2),
+        max_features=20000
+    )
+    X = vectorizer.fit_transform(df["text"].fillna("")).tocsr()
+    terms = vectorizer.get_feature_names_out().astype(str)
+    
+    # Write then rename so no worker maps a partial directory
+    tmp_dir = f"{cache_dir}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(tmp_dir, exist_ok=True)
+        for name, array in zip(TFIDF_ARRAYS, (X.data, X.indices, X.indptr, terms)):
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), array)
+        if unreadable:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        # Fails if another worker has just written the same cache; theirs is kept
+        os.replace(tmp_dir, cache_dir)
+    except Exception as e:
+        print(f"⚠️  Could not cache TF-IDF matrix: {e}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return X, terms
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _csr_row_sums_jit(indptr, indices, data, rows, n_cols):
+        sums = np.zeros(n_cols)
+        for r in rows:
+            for k in range(indptr[r], indptr[r + 1]):
+                sums[indices[k]] += data[k]
+        return sums
+
+
+def _csr_column_sums(X, rows: Optional[np.ndarray]) -> np.ndarray:
+    """Column sums of X over the given rows (all rows if None), without slicing out a new CSR matrix"""
+    if not NUMBA_AVAILABLE:
+        return np.asarray((X if rows is None else X[rows]).sum(axis=0)).ravel()
+    if rows is None:
+        rows = np.arange(X.shape[0])
+    return _csr_row_sums_jit(np.asarray(X.indptr), np.asarray(X.indices), np.asarray(X.data), rows, X.shape[1])
+
+@cached_response
+def _compute_top_keywords(date_from: Optional[str], date_to: Optional[str], top_k: int):
+    """Get top TF-IDF keywords"""
+    try:
+        X, terms = _tfidf_index()
+    except:
+        return {"data": []}
+    
+    # Sum the precomputed rows of the date window instead of refitting on it
+    scores = _csr_column_sums(X, date_positions(date_from, date_to))
+    
+    k = min(max(top_k, 0), len(scores))
+    top = np.argpartition(-scores, k - 1)[:k] if 0 < k < len(scores) else np.arange(k)
+    top = top[np.argsort(-scores[top], kind="stable")]
+    
+    return {"data": [{"keyword": str(terms[i]), "score": float(scores[i])} for i in top if scores[i] > 0]}
+
 @app.get("/api/top-keywords")
 def get_top_keywords(
     date_from: Optional[str] = Query(None),
@@ -342,92 +718,54 @@ def get_top_keywords(
     top_k: int = Query(15)
 ):
     """Get top TF-IDF keywords"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
-    
-    # Sample for performance
-    texts = df["text"].dropna().head(500).tolist()
-    
-    try:
-        vectorizer = TfidfVectorizer(
-            stop_words='english',
-            max_df=0.85,
-            min_df=2,
-            ngram_range=(1, 2),
-            max_features=top_k
-        )
-        X = vectorizer.fit_transform(texts)
-        scores = np.asarray(X.sum(axis=0)).ravel()
-        terms = np.array(vectorizer.get_feature_names_out())
-        
-        keywords = [{"keyword": term, "score": float(score)} 
-                   for term, score in zip(terms, scores)]
-        keywords.sort(key=lambda x: x["score"], reverse=True)
-        
-        return {"data": keywords[:top_k]}
-    except:
-        return {"data": []}
+    return _compute_top_keywords(date_from, date_to, top_k)
 
-@app.get("/api/geographic-data")
-def get_geographic_data(
-    date_from: Optional[str] = Query(None),
-    date_to: Optional[str] = Query(None)
-):
+@cached_response
+def _compute_geographic_data(date_from: Optional[str], date_to: Optional[str]):
     """Get document counts by country"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     # Filter out Unknown and empty values
     df = df[df["country"].notna()]
     df = df[df["country"] != "Unknown"]
     df = df[df["country"] != ""]
     
-    geo = df.groupby("country").size().reset_index(name="count")
+    geo = _label_counts(df["country"], "count")
     geo = geo.sort_values("count", ascending=False)
     
     # Add ISO3 codes
-    def to_iso3(name):
-        try:
-            return pycountry.countries.lookup(name).alpha_3
-        except:
-            return None
-    
-    geo["iso3"] = geo["country"].apply(to_iso3)
+    geo["iso3"] = geo["country"].map(iso3_codes)
     
     return {
-        "data": geo.to_dict(orient="records")
+        "data": _records(geo)
     }
 
+@app.get("/api/geographic-data")
+def get_geographic_data(
+    date_from: Optional[str] = Query(None),
+    date_to: Optional[str] = Query(None)
+):
+    """Get document counts by country"""
+    return _compute_geographic_data(date_from, date_to)
+
 @app.get("/api/topic-trends")
 def get_topic_trends(
+    request: Request,
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
     period: str = Query("month")
 ):
     """Get topic frequency over time"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     time_col = "ym" if period == "month" else "quarter"
     
     if "topic" in df.columns:
-        topic_counts = df.groupby([time_col, "topic"]).size().reset_index(name="count")
-        top_topics = topic_counts.groupby("topic")["count"].sum().sort_values(ascending=False).head(10).index.tolist()
+        topic_counts = df.groupby([time_col, "topic"], observed=True).size().reset_index(name="count")
+        top_topics = topic_counts.groupby("topic", observed=True)["count"].sum().sort_values(ascending=False).head(10).index.tolist()
         filtered = topic_counts[topic_counts["topic"].isin(top_topics)]
         
-        return {"data": filtered.to_dict(orient="records")}
+        return _data_response(request, filtered)
     
     return {"data": []}
 
@@ -439,7 +777,7 @@ def chat_assistant(request: ChatRequest):
     # Try hybrid assistant first, fallback to basic assistant
     active_assistant = hybrid_assistant if hybrid_assistant else assistant
     
-    if active_assistant is None:
+    if not assistants_ready.is_set() or active_assistant is None:
         return {"answer": "Assistant is initializing. Please try again in a moment."}
     
     try:
@@ -477,19 +815,10 @@ def chat_assistant(request: ChatRequest):
     except Exception as e:
         return {"answer": f"I apologize, but I encountered an error processing your question: {str(e)}"}
 
-@app.get("/api/authority-sentiment")
-def get_authority_sentiment(
-    date_from: Optional[str] = Query(None),
-    date_to: Optional[str] = Query(None),
-    top_k: int = Query(10)
-):
+@cached_response
+def _compute_authority_sentiment(date_from: Optional[str], date_to: Optional[str], top_k: int):
     """Get sentiment patterns by authority"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     # Filter out Unknown authorities
     df = df[df["authority"].notna()]
@@ -497,16 +826,16 @@ def get_authority_sentiment(
     df = df[df["authority"] != ""]
     
     # Get top authorities by document count
-    top_authorities = df["authority"].value_counts().head(top_k).index.tolist()
+    top_authorities = _value_counts(df["authority"]).head(top_k).index.tolist()
     df_filtered = df[df["authority"].isin(top_authorities)]
     
     # Use existing sentiment column if available
     results = []
     
     if "sentiment" in df.columns:
+        counts = _count_table(df_filtered, "authority", "sentiment").astype(int)
         for authority in top_authorities:
-            auth_df = df_filtered[df_filtered["authority"] == authority]
-            sentiment_counts = auth_df["sentiment"].value_counts().to_dict()
+            sentiment_counts = counts.loc[authority].to_dict()
             
             results.append({
                 "authority": authority,
@@ -519,38 +848,29 @@ def get_authority_sentiment(
                 "highlyPositive": sentiment_counts.get("highly positive", 0)
             })
     else:
-        # Fallback to VADER
-        sia = SentimentIntensityAnalyzer()
+        # Fallback to VADER scores of the documents with text
         for authority in top_authorities:
             auth_df = df_filtered[df_filtered["authority"] == authority]
-            sentiments = {"highlyNegative": 0, "negative": 0, "slightlyNegative": 0, 
-                         "neutral": 0, "slightlyPositive": 0, "positive": 0, "highlyPositive": 0}
-            
-            for text in auth_df["text"].head(100):
-                if isinstance(text, str) and text:
-                    comp = sia.polarity_scores(text).get("compound", 0.0)
-                    if comp <= -0.6:
-                        sentiments["highlyNegative"] += 1
-                    elif comp <= -0.2:
-                        sentiments["negative"] += 1
-                    elif comp < 0:
-                        sentiments["slightlyNegative"] += 1
-                    elif comp == 0:
-                        sentiments["neutral"] += 1
-                    elif comp < 0.2:
-                        sentiments["slightlyPositive"] += 1
-                    elif comp < 0.6:
-                        sentiments["positive"] += 1
-                    else:
-                        sentiments["highlyPositive"] += 1
+            compound = auth_df["sentiment_compound"].to_numpy() if "sentiment_compound" in auth_df.columns else np.empty(0)
+            compound = compound[~np.isnan(compound)]
+            counts = np.bincount(_sentiment_buckets(compound), minlength=len(SENTIMENT_KEYS))
             
             results.append({
                 "authority": authority,
-                **sentiments
+                **dict(zip(SENTIMENT_KEYS, counts.tolist()))
             })
     
     return {"data": results}
 
+@app.get("/api/authority-sentiment")
+def get_authority_sentiment(
+    date_from: Optional[str] = Query(None),
+    date_to: Optional[str] = Query(None),
+    top_k: int = Query(10)
+):
+    """Get sentiment patterns by authority"""
+    return _compute_authority_sentiment(date_from, date_to, top_k)
+
 @app.get("/api/authority-volume")
 def get_authority_volume(
     date_from: Optional[str] = Query(None),
@@ -558,17 +878,12 @@ def get_authority_volume(
     top_k: int = Query(10)
 ):
     """Get document volume by authority"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
-    volume = df.groupby("authority").size().reset_index(name="documents")
+    volume = _label_counts(df["authority"], "documents")
     volume = volume.sort_values("documents", ascending=False).head(top_k)
     
-    return {"data": volume.to_dict(orient="records")}
+    return {"data": _records(volume)}
 
 @app.get("/api/risk-levels")
 def get_risk_levels(
@@ -577,25 +892,11 @@ def get_risk_levels(
     period: str = Query("month")
 ):
     """Get risk level progression over time"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     time_col = "ym" if period == "month" else "quarter"
     
     if "risk_level" in df.columns:
-        risk_counts = df.groupby([time_col, "risk_level"]).size().reset_index(name="count")
-        # Pivot to get risk levels as columns
-        pivot = risk_counts.pivot(index=time_col, columns="risk_level", values="count").fillna(0)
-        pivot = pivot.reset_index()
-        pivot.columns.name = None
-        
-        # Rename time column to 'period' for consistency
-        pivot.rename(columns={time_col: "period"}, inplace=True)
-        
         # Ensure all risk level columns exist with proper naming
         risk_level_mapping = {
             "very low": "very low",
@@ -604,44 +905,51 @@ def get_risk_levels(
             "high": "high"
         }
         
+        if USE_POLARS:
+            pivot = _polars_count_table(date_from, date_to, time_col, "risk_level").rename({time_col: "period"})
+            missing = [col for col in risk_level_mapping.values() if col not in pivot.columns]
+            pivot = pivot.with_columns([pl.lit(0).alias(col) for col in missing])
+            return {"data": pivot.to_dicts()}
+        
+        # Count by time period with risk levels as columns
+        pivot = _count_table(df, time_col, "risk_level").reset_index()
+        pivot.columns.name = None
+        
+        # Rename time column to 'period' for consistency
+        pivot.rename(columns={time_col: "period"}, inplace=True)
+        
         for col in risk_level_mapping.values():
             if col not in pivot.columns:
                 pivot[col] = 0
         
-        return {"data": pivot.to_dict(orient="records")}
+        return {"data": _records(pivot)}
     
     return {"data": []}
 
 @app.get("/api/authority-activity")
 def get_authority_activity(
+    request: Request,
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
     top_k: int = Query(5),
     period: str = Query("month")
 ):
     """Get authority activity over time"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     time_col = "ym" if period == "month" else "quarter"
     
     # Get top authorities
-    top_authorities = df["authority"].value_counts().head(top_k).index.tolist()
+    top_authorities = _value_counts(df["authority"]).head(top_k).index.tolist()
+    if USE_POLARS:
+        return _data_response(request, _polars_count_table(date_from, date_to, time_col, "authority", keep=top_authorities))
     df_filtered = df[df["authority"].isin(top_authorities)]
     
-    # Group by time and authority
-    activity = df_filtered.groupby([time_col, "authority"]).size().reset_index(name="count")
-    
-    # Pivot to get authorities as columns
-    pivot = activity.pivot(index=time_col, columns="authority", values="count").fillna(0)
-    pivot = pivot.reset_index()
+    # Count by time with authorities as columns
+    pivot = _count_table(df_filtered, time_col, "authority").reset_index()
     pivot.columns.name = None
     
-    return {"data": pivot.to_dict(orient="records")}
+    return _data_response(request, pivot)
 
 @app.get("/api/document-types")
 def get_document_types(
@@ -649,39 +957,25 @@ def get_document_types(
     date_to: Optional[str] = Query(None)
 ):
     """Get document type distribution"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     if "document_type" in df.columns:
         df = df[df["document_type"].notna()]
         df = df[df["document_type"] != "Unknown"]
         df = df[df["document_type"] != ""]
         
-        doc_types = df.groupby("document_type").size().reset_index(name="count")
+        doc_types = _label_counts(df["document_type"], "count")
         doc_types = doc_types.sort_values("count", ascending=False)
         
-        return {"data": doc_types.to_dict(orient="records")}
+        return {"data": _records(doc_types)}
     
     return {"data": []}
 
 @app.get("/api/filters")
 def get_filter_options():
     """Get available filter options"""
-    df = load_data()
-    
-    return {
-        "countries": sorted(df["country"].dropna().unique().tolist()),
-        "topics": sorted(df["topic"].dropna().unique().tolist()) if "topic" in df.columns else [],
-        "authorities": sorted(df["authority"].dropna().unique().tolist()),
-        "date_range": {
-            "min": df["date"].min().isoformat() if pd.notna(df["date"].min()) else None,
-            "max": df["date"].max().isoformat() if pd.notna(df["date"].max()) else None
-        }
-    }
+    load_data()
+    return filter_options
 
 @app.get("/api/document-types")
 def get_document_types(
@@ -689,22 +983,17 @@ def get_document_types(
     date_to: Optional[str] = Query(None)
 ):
     """Get document type distribution"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     if "document_type" in df.columns:
         df = df[df["document_type"].notna()]
         df = df[df["document_type"] != "Unknown"]
         df = df[df["document_type"] != ""]
         
-        doc_types = df.groupby("document_type").size().reset_index(name="count")
+        doc_types = _label_counts(df["document_type"], "count")
         doc_types = doc_types.sort_values("count", ascending=False)
         
-        return {"data": doc_types.to_dict(orient="records")}
+        return {"data": _records(doc_types)}
     
     return {"data": []}
 
@@ -715,23 +1004,20 @@ def get_risk_over_time(
     period: str = Query("month")
 ):
     """Get risk level distribution over time"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     time_col = "ym" if period == "month" else "quarter"
     
     if "risk_level" in df.columns:
-        risk_counts = df.groupby([time_col, "risk_level"]).size().reset_index(name="count")
-        pivot = risk_counts.pivot(index=time_col, columns="risk_level", values="count").fillna(0)
-        pivot = pivot.reset_index()
+        if USE_POLARS:
+            pivot = _polars_count_table(date_from, date_to, time_col, "risk_level")
+            return {"data": pivot.rename({time_col: "period"}).to_dicts()}
+        
+        pivot = _count_table(df, time_col, "risk_level").reset_index()
         pivot.columns.name = None
         pivot.rename(columns={time_col: "period"}, inplace=True)
         
-        return {"data": pivot.to_dict(orient="records")}
+        return {"data": _records(pivot)}
     
     return {"data": []}
 
@@ -741,21 +1027,16 @@ def get_language_distribution(
     date_to: Optional[str] = Query(None)
 ):
     """Get language distribution"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     if "language" in df.columns:
         df = df[df["language"].notna()]
         df = df[df["language"] != ""]
         
-        lang_dist = df.groupby("language").size().reset_index(name="count")
+        lang_dist = _label_counts(df["language"], "count")
         lang_dist = lang_dist.sort_values("count", ascending=False)
         
-        return {"data": lang_dist.to_dict(orient="records")}
+        return {"data": _records(lang_dist)}
     
     return {"data": []}
 
@@ -765,22 +1046,17 @@ def get_status_distribution(
     date_to: Optional[str] = Query(None)
 ):
     """Get document status distribution"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     if "status" in df.columns:
         df = df[df["status"].notna()]
         df = df[df["status"] != "Unknown"]
         df = df[df["status"] != ""]
         
-        status_dist = df.groupby("status").size().reset_index(name="count")
+        status_dist = _label_counts(df["status"], "count")
         status_dist = status_dist.sort_values("count", ascending=False)
         
-        return {"data": status_dist.to_dict(orient="records")}
+        return {"data": _records(status_dist)}
     
     return {"data": []}
 
@@ -790,43 +1066,34 @@ def get_regional_comparison(
     date_to: Optional[str] = Query(None)
 ):
     """Get regional document volume comparison"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     if "region" in df.columns:
         df = df[df["region"].notna()]
         df = df[df["region"] != "Unknown"]
         df = df[df["region"] != ""]
         
-        regional = df.groupby("region").size().reset_index(name="documents")
+        regional = _label_counts(df["region"], "documents")
         regional = regional.sort_values("documents", ascending=False)
         
-        return {"data": regional.to_dict(orient="records")}
+        return {"data": _records(regional)}
     
     return {"data": []}
 
 @app.get("/api/sentiment-risk-correlation")
 def get_sentiment_risk_correlation(
+    request: Request,
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None)
 ):
     """Get sentiment vs risk correlation data"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     if "sentiment_score" in df.columns and "risk_score" in df.columns:
         # Sample for performance
         df_sample = df[["sentiment_score", "risk_score", "title"]].dropna().sample(min(500, len(df)))
         
-        return {"data": df_sample.to_dict(orient="records")}
+        return _data_response(request, df_sample)
     
     return {"data": []}
 
@@ -836,24 +1103,17 @@ def get_document_length_distribution(
     date_to: Optional[str] = Query(None)
 ):
     """Get document length distribution"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     if "document_length" in df.columns:
-        df = df[df["document_length"].notna()]
-        
         # Create bins for document length
         bins = [0, 100, 200, 300, 400, 500, 1000, 5000, 10000]
         labels = ["0-100", "100-200", "200-300", "300-400", "400-500", "500-1K", "1K-5K", "5K+"]
         
-        df["length_category"] = pd.cut(df["document_length"], bins=bins, labels=labels, include_lowest=True)
-        length_dist = df.groupby("length_category", observed=True).size().reset_index(name="count")
+        counts = _bin_counts(df["document_length"], bins)
+        length_dist = [{"length_category": label, "count": int(count)} for label, count in zip(labels, counts) if count]
         
-        return {"data": length_dist.to_dict(orient="records")}
+        return {"data": length_dist}
     
     return {"data": []}
 
@@ -863,32 +1123,29 @@ def get_confidence_metrics(
     date_to: Optional[str] = Query(None)
 ):
     """Get confidence score metrics"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     if "confidence_score" in df.columns:
-        df = df[df["confidence_score"].notna()]
+        scores = df["confidence_score"].to_numpy(dtype=np.float64, na_value=np.nan)
+        scores = scores[~np.isnan(scores)]
         
-        avg_confidence = float(df["confidence_score"].mean())
-        min_confidence = float(df["confidence_score"].min())
-        max_confidence = float(df["confidence_score"].max())
+        # NaN (null) for an empty window, as the pandas reductions gave
+        avg_confidence = float(scores.mean()) if len(scores) else np.nan
+        min_confidence = float(scores.min()) if len(scores) else np.nan
+        max_confidence = float(scores.max()) if len(scores) else np.nan
         
         # Distribution by ranges
         bins = [0, 0.5, 0.7, 0.85, 0.95, 1.0]
         labels = ["Low (0-0.5)", "Medium (0.5-0.7)", "Good (0.7-0.85)", "High (0.85-0.95)", "Excellent (0.95-1.0)"]
         
-        df["confidence_category"] = pd.cut(df["confidence_score"], bins=bins, labels=labels, include_lowest=True)
-        conf_dist = df.groupby("confidence_category", observed=True).size().reset_index(name="count")
+        counts = _bin_counts(df["confidence_score"], bins)
+        conf_dist = [{"confidence_category": label, "count": int(count)} for label, count in zip(labels, counts) if count]
         
         return {
             "average": round(avg_confidence, 3),
             "min": round(min_confidence, 3),
             "max": round(max_confidence, 3),
-            "distribution": conf_dist.to_dict(orient="records")
+            "distribution": conf_dist
         }
     
     return {"average": 0, "min": 0, "max": 0, "distribution": []}
@@ -900,31 +1157,21 @@ def get_topic_wordcloud(
     top_k: int = Query(50)
 ):
     """Get topic and tags data for word cloud"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     words = []
     
     # Extract from topics
     if "topic" in df.columns:
-        topics = df["topic"].dropna().tolist()
-        for topic in topics:
-            if isinstance(topic, str):
-                words.extend(topic.split())
+        words.append(pd.Series(df["topic"].to_numpy(), dtype=object).dropna().str.split().explode())
     
     # Extract from tags
     if "tags" in df.columns:
-        tags = df["tags"].dropna().tolist()
-        for tag in tags:
-            if isinstance(tag, str):
-                words.extend(tag.split(","))
+        words.append(pd.Series(df["tags"].to_numpy(), dtype=object).dropna().str.split(",").explode())
     
     # Count word frequencies
-    word_counts = pd.Series([w.strip().lower() for w in words if w.strip()]).value_counts().head(top_k)
+    words = pd.concat(words, ignore_index=True).str.strip().str.lower() if words else pd.Series(dtype=object)
+    word_counts = words[words.notna() & (words != "")].value_counts().head(top_k)
     
     return {
         "data": [{"text": word, "value": int(count)} for word, count in word_counts.items()]
@@ -937,48 +1184,78 @@ def get_authority_network(
     top_k: int = Query(20)
 ):
     """Get authority-country network data"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = load_data()
     
     if "authority" in df.columns and "country" in df.columns:
-        df = df[df["authority"].notna() & df["country"].notna()]
-        df = df[(df["authority"] != "Unknown") & (df["country"] != "Unknown")]
+        # Pair codes of the window's rows, computed once at load; missing and Unknown ones dropped
+        rows = date_positions(date_from, date_to)
+        pairs = edge_codes if rows is None else edge_codes[rows]
+        pairs = pairs[pairs >= 0]
+        authorities = df["authority"].cat.categories
+        countries = df["country"].cat.categories
         
-        # Get top authorities
-        top_authorities = df["authority"].value_counts().head(top_k).index.tolist()
-        df_filtered = df[df["authority"].isin(top_authorities)]
+        # One bincount gives every (authority, country) count; authority totals are its row sums
+        counts = np.bincount(pairs, minlength=len(authorities) * len(countries)).reshape(len(authorities), len(countries))
+        
+        # Get top authorities, ranked like _value_counts: observed ones in first-appearance order, then by count
+        observed = pd.unique(pairs // len(countries))
+        totals = pd.Series(counts[observed].sum(axis=1), index=authorities[observed])
+        top_authorities = totals.sort_values(ascending=False).head(top_k).index.tolist()
+        
+        if USE_POLARS:
+            network = (
+                _polars_window(date_from, date_to)
+                .filter(pl.col("authority").is_in(top_authorities) & pl.col("country").is_not_null() & (pl.col("country") != "Unknown"))
+                .group_by(["authority", "country"])
+                .agg(pl.len().cast(pl.Int64).alias("documents"))
+                .sort(["authority", "country"])
+                .collect()
+            )
+            return {"data": network.to_dicts()}
         
-        # Create network data
-        network = df_filtered.groupby(["authority", "country"]).size().reset_index(name="documents")
+        # Create network data: the top authorities' nonzero cells, in (authority, country) label order
+        top_codes = np.sort(authorities.get_indexer(top_authorities))
+        authority_idx, country_idx = np.nonzero(counts[top_codes])
+        network = [
+            {"authority": authorities[top_codes[a]], "country": countries[c], "documents": int(counts[top_codes[a], c])}
+            for a, c in zip(authority_idx, country_idx)
+        ]
         
-        return {"data": network.to_dict(orient="records")}
+        return {"data": network}
     
     return {"data": []}
 
-@app.get("/api/quarterly-comparison")
-def get_quarterly_comparison(
-    date_from: Optional[str] = Query(None),
-    date_to: Optional[str] = Query(None)
-):
+@cached_response
+def _compute_quarterly_comparison(date_from: Optional[str], date_to: Optional[str]):
     """Get year-over-year quarterly comparison"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     if "year" in df.columns and "quarter" in df.columns:
-        quarterly = df.groupby(["year", "quarter"]).size().reset_index(name="documents")
+        if USE_POLARS:
+            quarterly = (
+                _polars_window(date_from, date_to)
+                .filter(pl.col("year").is_not_null() & pl.col("quarter").is_not_null())
+                .group_by(["year", "quarter"])
+                .agg(pl.len().cast(pl.Int64).alias("documents"))
+                .sort(["year", "quarter"])
+                .collect()
+            )
+            return {"data": quarterly.to_dicts()}
+        
+        quarterly = df.groupby(["year", "quarter"], observed=True).size().reset_index(name="documents")
         
-        return {"data": quarterly.to_dict(orient="records")}
+        return {"data": _records(quarterly)}
     
     return {"data": []}
 
+@app.get("/api/quarterly-comparison")
+def get_quarterly_comparison(
+    date_from: Optional[str] = Query(None),
+    date_to: Optional[str] = Query(None)
+):
+    """Get year-over-year quarterly comparison"""
+    return _compute_quarterly_comparison(date_from, date_to)
+
 @app.get("/api/tags-trends")
 def get_tags_trends(
     date_from: Optional[str] = Query(None),
@@ -986,32 +1263,36 @@ def get_tags_trends(
     top_k: int = Query(15)
 ):
     """Get trending tags over time"""
-    df = load_data().copy()
-    
-    if date_from:
-        df = df[df["date"] >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[df["date"] <= pd.to_datetime(date_to)]
+    df = filter_by_date(date_from, date_to)
     
     if "tags" in df.columns and "ym" in df.columns:
-        # Extract individual tags
-        tag_data = []
-        for _, row in df.iterrows():
-            if pd.notna(row["tags"]) and isinstance(row["tags"], str):
-                tags = [t.strip() for t in row["tags"].split(",")]
-                for tag in tags[:3]:  # Take first 3 tags
-                    if tag:
-                        tag_data.append({"period": row["ym"], "tag": tag})
+        # Extract individual tags: the first 3 of each document, one row per (document, tag)
+        tags = pd.Series(df["tags"].to_numpy(), dtype=object).dropna().str.split(",").str[:3].explode().str.strip()
+        tags = tags[tags.notna() & (tags != "")]
         
-        if tag_data:
-            tag_df = pd.DataFrame(tag_data)
-            tag_counts = tag_df.groupby("tag").size().sort_values(ascending=False).head(top_k).index.tolist()
+        if len(tags):
+            # The exploded index holds each tag's row position in df
+            periods = df["ym"].cat.codes.to_numpy().astype(np.int64)[tags.index.to_numpy()]
+            period_labels = df["ym"].cat.categories
+            tags = pd.Categorical(tags.to_numpy())
+            tag_codes = tags.codes.astype(np.int64)
+            
+            # Rank tags by total count, ties ordered as groupby("tag").size().sort_values() orders them
+            tag_totals = pd.Series(np.bincount(tag_codes, minlength=len(tags.categories)), index=tags.categories)
+            top_tags = tag_totals.sort_values(ascending=False).head(top_k).index
+            top_codes = np.sort(tags.categories.get_indexer(top_tags))
             
-            # Filter to top tags and count by period
-            filtered = tag_df[tag_df["tag"].isin(tag_counts)]
-            trend_data = filtered.groupby(["period", "tag"]).size().reset_index(name="count")
+            # Count by period and tag in one bincount, then keep the top tags' nonzero cells in (period, tag) order
+            dated = periods >= 0
+            counts = np.bincount(periods[dated] * len(tags.categories) + tag_codes[dated],
+                                 minlength=len(period_labels) * len(tags.categories))
+            counts = counts.reshape(len(period_labels), len(tags.categories))[:, top_codes]
+            trend_data = [
+                {"period": period_labels[p], "tag": tags.categories[top_codes[t]], "count": int(counts[p, t])}
+                for p, t in zip(*np.nonzero(counts))
+            ]
             
-            return {"data": trend_data.to_dict(orient="records")}
+            return {"data": trend_data}
     
     return {"data": []}
 
@@ -1035,125 +1316,282 @@ def intelligent_query(request: Dict[str, Any]):
     except Exception as e:
         return {"error": str(e)}
 
-@app.get("/api/example-questions")
-def get_example_questions():
-    """Get example questions users can ask the Hybrid LLM Assistant"""
-    return {
-        "assistant_type": "hybrid_llm" if hybrid_assistant else "basic",
-        "examples": [
-            {
-                "category": "📊 Analytical Queries (Pandas)",
-                "description": "Statistical analysis and aggregations",
-                "questions": [
-                    "How many documents are in the dataset?",
-                    "What's the average sentiment by country?",
-                    "Compare US vs EU sentiment scores",
-                    "Which authority publishes the most documents?",
-                    "Show me document trends over time",
-                    "What is the sentiment trend from 2023 to 2025?",
-                    "Which regions have the highest document count?"
-                ]
-            },
-            {
-                "category": "📄 Document Retrieval (RAG)",
-                "description": "Find and retrieve specific documents",
-                "questions": [
-                    "Show me documents about AI ethics",
-                    "Find regulations from the European Commission",
-                    "What documents discuss AI safety?",
-                    "Retrieve documents with negative sentiment",
-                    "Tell me about the National Defense Authorization Act",
-                    "Show me documents about AI governance in the US",
-                    "Find reports about AI risk assessment"
-                ]
-            },
-            {
-                "category": "🔄 Hybrid Queries (Both)",
-                "description": "Combines analytics with document content",
-                "questions": [
-                    "Summarize US AI regulations and their sentiment",
-                    "What are the main topics in high-risk documents?",
-                    "Compare document content between US and EU",
-                    "Analyze sentiment trends and show example documents",
-                    "What do positive sentiment documents say about AI?",
-                    "Show me statistics and documents about AI Act"
-                ]
-            },
-            {
-                "category": "🌍 Geographic Analysis",
-                "description": "Country and regional comparisons",
-                "questions": [
-                    "Which countries are covered in the dataset?",
-                    "Compare sentiment between US and China",
-                    "What regions have the most positive outlook?",
-                    "Show me European vs Asian AI regulations",
-                    "Which country has the most documents?"
-                ]
-            },
-            {
-                "category": "🏢 Authority Analysis",
-                "description": "Analyze regulatory authorities",
-                "questions": [
-                    "What authorities are in this dataset?",
-                    "Which authority has the most negative outlook?",
-                    "Compare US Congress vs European Commission",
-                    "List top 5 authorities by document count"
-                ]
-            },
-            {
-                "category": "📈 Trend & Topic Analysis",
-                "description": "Temporal patterns and themes",
-                "questions": [
-                    "What are the main topics discussed in 2024?",
-                    "Show me how AI Safety was trending over time",
-                    "What topics are associated with high-risk scores?",
-                    "Which tags are most frequent?",
-                    "How has AI regulation evolved over time?"
-                ]
-            },
-            {
-                "category": "⚠️ Risk Analysis",
-                "description": "Risk level assessment",
-                "questions": [
-                    "What is the risk level distribution?",
-                    "How many high-risk regulations exist?",
-                    "Analyze risk patterns"
-                ]
-            },
-            {
-                "category": "🕐 Recent Activity",
-                "description": "Latest documents and updates",
-                "questions": [
-                    "What's the latest activity?",
-                    "Show me recent documents",
-                    "What happened recently?",
-                    "What are the newest regulations?"
-                ]
-            },
-            {
-                "category": "📋 Summary & Overview",
-                "description": "Dataset overview and key statistics",
-                "questions": [
-                    "Give me an overview of the dataset",
-                    "Summarize the key statistics",
-                    "What are the main insights?",
-                    "Provide a comprehensive summary"
-                ]
-            }
-        ],
-        "tips": [
-            "💡 Ask specific questions for better results",
-            "🔍 Use keywords like 'compare', 'show', 'analyze' for targeted queries",
-            "📊 Analytical queries return statistics and charts",
-            "📄 Document queries return actual regulation content",
-            "🔄 Hybrid queries combine both approaches for comprehensive answers"
+# Static parts of the /api/example-questions response
+EXAMPLE_QUESTIONS = [
+    {
+        "category": "📊 Analytical Queries (Pandas)",
+        "description": "Statistical analysis and aggregations",
+        "questions": [
+            "How many documents are in the dataset?",
+            "What's the average sentiment by country?",
+            "Compare US vs EU sentiment scores",
+            "Which authority publishes the most documents?",
+            "Show me document trends over time",
+            "What is the sentiment trend from 2023 to 2025?",
+            "Which regions have the highest document count?"
+        ]
+    },
+    {
+        "category": "📄 Document Retrieval (RAG)",
+        "description": "Find and retrieve specific documents",
+        "questions": [
+            "Show me documents about AI ethics",
+            "Find regulations from the European Commission",
+            "What documents discuss AI safety?",
+            "Retrieve documents with negative sentiment",
+            "Tell me about the National Defense Authorization Act",
+            "Show me documents about AI governance in the US",
+            "Find reports about AI risk assessment"
+        ]
+    },
+    {
+        "category": "🔄 Hybrid Queries (Both)",
+        "description": "Combines analytics with document content",
+        "questions": [
+            "Summarize US AI regulations and their sentiment",
+            "What are the main topics in high-risk documents?",
+            "Compare document content between US and EU",
+            "Analyze sentiment trends and show example documents",
+            "What do positive sentiment documents say about AI?",
+            "Show me statistics and documents about AI Act"
+        ]
+    },
+    {
+        "category": "🌍 Geographic Analysis",
+        "description": "Country and regional comparisons",
+        "questions": [
+            "Which countries are covered in the dataset?",
+            "Compare sentiment between US and China",
+            "What regions have the most positive outlook?",
+            "Show me European vs Asian AI regulations",
+            "Which country has the most documents?"
+        ]
+    },
+    {
+        "category": "🏢 Authority Analysis",
+        "description": "Analyze regulatory authorities",
+        "questions": [
+            "What authorities are in this dataset?",
+            "Which authority has the most negative outlook?",
+            "Compare US Congress vs European Commission",
+            "List top 5 authorities by document count"
+        ]
+    },
+    {
+        "category": "📈 Trend & Topic Analysis",
+        "description": "Temporal patterns and themes",
+        "questions": [
+            "What are the main topics discussed in 2024?",
+            "Show me how AI Safety was trending over time",
+            "What topics are associated with high-risk scores?",
+            "Which tags are most frequent?",
+            "How has AI regulation evolved over time?"
+        ]
+    },
+    {
+        "category": "⚠️ Risk Analysis",
+        "description": "Risk level assessment",
+        "questions": [
+            "What is the risk level distribution?",
+            "How many high-risk regulations exist?",
+            "Analyze risk patterns"
+        ]
+    },
+    {
+        "category": "🕐 Recent Activity",
+        "description": "Latest documents and updates",
+        "questions": [
+            "What's the latest activity?",
+            "Show me recent documents",
+            "What happened recently?",
+            "What are the newest regulations?"
+        ]
+    },
+    {
+        "category": "📋 Summary & Overview",
+        "description": "Dataset overview and key statistics",
+        "questions": [
+            "Give me an overview of the dataset",
+            "Summarize the key statistics",
+            "What are the main insights?",
+            "Provide a comprehensive summary"
         ]
     }
+]
+
+EXAMPLE_TIPS = [
+    "💡 Ask specific questions for better results",
+    "🔍 Use keywords like 'compare', 'show', 'analyze' for targeted queries",
+    "📊 Analytical queries return statistics and charts",
+    "📄 Document queries return actual regulation content",
+    "🔄 Hybrid queries combine both approaches for comprehensive answers"
+]
+
+@lru_cache(maxsize=2)
+def _example_questions_body(assistant_type: str):
+    """Serialized /api/example-questions response and its ETag; only the assistant type varies"""
+    body = DefaultResponse({"assistant_type": assistant_type, "examples": EXAMPLE_QUESTIONS, "tips": EXAMPLE_TIPS}).body
+    return body, f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+@app.get("/api/example-questions")
+def get_example_questions(request: Request):
+    """Get example questions users can ask the Hybrid LLM Assistant"""
+    body, etag = _example_questions_body("hybrid_llm" if hybrid_assistant else "basic")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+# LLM prompts, parsed once at import; filled in per request with Template.substitute
+CHART_INSIGHTS_PROMPT = string.Template("""You are a senior business analyst writing a professional report. Generate a detailed analysis for this chart.
+
+CONTEXT:
+Chart: ${chart_type}
+Section: ${tab_name}
+Period: ${date_range}
+Dataset: ${total_docs} documents, ${countries} countries, ${authorities} authorities
+Additional: ${context_data}
+
+INSTRUCTIONS:
+Write a professional analysis following this EXACT structure. Do NOT use asterisks, bullet points, or markdown. Write in plain text paragraphs with proper capitalization and punctuation.
+
+FORMAT:
+
+Based on the ${chart_type} chart covering ${date_range}, analyzing ${total_docs} documents across ${countries} countries and ${authorities} authorities, the following insights were identified:
+
+Dominant Trends:
+Write 2-3 complete sentences describing the main trend or pattern visible in the chart. Include specific percentages or numbers from the data. Explain what this trend indicates for stakeholders and why it matters.
+
+Key Findings:
+Write 2-3 complete sentences identifying notable observations, anomalies, or significant changes in the data. Reference specific time periods, categories, or data points. Explain the likely causes or business implications of these findings.
+
+Comparative Analysis:
+Write 2-3 complete sentences comparing different segments such as countries, time periods, or categories. Highlight any outliers or significant differences. Provide potential explanations such as policy changes, economic factors, or market dynamics.
+
+Strategic Implications:
+Write 2-3 complete sentences explaining how these insights can inform decision-making, risk management, and strategic planning. Provide specific, actionable recommendations for stakeholders to consider implementing.
+
+CRITICAL RULES:
+- NO asterisks (**), NO bullet points, NO markdown
+- Write in complete sentences with proper grammar
+- Start each section header with a capital letter and end with a colon
+- Use professional business language
+- Include specific numbers and data points
+- Total length: 200-250 words
+- Write as if for an executive audience
+
+Generate the analysis now:""")
+
+DOCUMENT_CHAT_PROMPT = string.Template("""You are a professional AI Regulation & Compliance Assistant. Answer the user's question based on the uploaded document.
+
+**Document:** ${filename}
+
+**Document Content:**
+${document}
+
+**User Question:** ${query}
+
+**Instructions:**
+- Answer directly and professionally
+- Cite specific sections from the document when relevant
+- Use clear formatting with headings and bullet points
+- If the answer isn't in the document, say so clearly
+
+**Your Answer:**""")
+
+DOCUMENT_ANALYSIS_PROMPT = string.Template("""You are a professional AI Regulation & Compliance Analyst. Analyze the following legal/regulatory document and provide a comprehensive, well-structured report.
+
+**Document:** ${filename}
+
+**Analysis Requirements:**
+
+# 📋 Executive Summary
+Provide a 2-3 sentence overview of the document's purpose and significance.
+
+# 🎯 Key Regulations & Guidelines
+List the main regulatory requirements and compliance guidelines with specific references.
+
+# ✅ Compliance Requirements
+Detail specific actions, standards, or obligations that organizations must follow:
+- Use bullet points for clarity
+- Include specific requirements
+- Note any deadlines or timelines
+
+# ⚠️ Risk Assessment
+Identify potential compliance risks and areas of concern:
+- High-risk areas
+- Common pitfalls
+- Recommended mitigation strategies
+
+# 🤖 Relevant AI/ML Technologies
+List AI/ML technologies or systems mentioned:
+- Facial recognition
+- Computer vision
+- Natural language processing
+- Machine learning models
+- Other relevant technologies
+
+# 🌍 Geographic Scope
+Specify jurisdictions, regions, or countries covered by this regulation.
+
+# 💡 Key Takeaways
+Provide 5-7 actionable bullet points summarizing the most critical information for compliance officers and AI developers.
+
+---
+
+**Document Content:**
+${document}
+
+---
+
+**Provide your professional analysis below:**""")
+
+def _generate_text(prompt: str) -> str:
+    """Answer prompt with the hybrid assistant's LLM (native Gemini SDK or LangChain); blocks for the whole call"""
+    if hasattr(hybrid_assistant, 'llm_type') and hybrid_assistant.llm_type == "native":
+        return hybrid_assistant.llm.generate_content(prompt).text
+    response = hybrid_assistant.llm.invoke(prompt)
+    return response.content if hasattr(response, 'content') else str(response)
+
+def _stream_text(prompt: str) -> Iterator[str]:
+    """_generate_text as server-sent events, one per chunk as the LLM produces it.
+
+    A plain generator: StreamingResponse pulls it on a worker thread, so the
+    blocking LLM calls stay off the event loop.
+    """
+    try:
+        if hasattr(hybrid_assistant, 'llm_type') and hybrid_assistant.llm_type == "native":
+            chunks = (chunk.text for chunk in hybrid_assistant.llm.generate_content(prompt, stream=True))
+        else:
+            chunks = (chunk.content if hasattr(chunk, 'content') else str(chunk) for chunk in hybrid_assistant.llm.stream(prompt))
+        for text in chunks:
+            yield f"data: {json.dumps(text)}\n\n"
+    except Exception as e:
+        yield f"event: error\ndata: {json.dumps(str(e))}\n\n"
+
+# LLM calls in flight, by prompt; only touched from the event loop thread
+_pending_generations: Dict[str, asyncio.Future] = {}
+
+async def _generate_text_async(prompt: str) -> str:
+    """_generate_text on a worker thread, so other requests keep being served meanwhile.
+
+    Concurrent requests with the same prompt (a report asking for the same
+    chart's insights more than once) share a single LLM call.
+    """
+    pending = _pending_generations.get(prompt)
+    if pending is None:
+        pending = asyncio.get_running_loop().run_in_executor(None, _generate_text, prompt)
+        _pending_generations[prompt] = pending
+        pending.add_done_callback(lambda _: _pending_generations.pop(prompt, None))
+    # Shielded: a client that disconnects must not cancel the call for the others
+    return await asyncio.shield(pending)
 
 @app.post("/api/generate-chart-insights")
 async def generate_chart_insights(request: Dict[str, Any]):
     """
     Generate AI-powered insights for charts in the report
+    
+    With "stream": true (and an LLM configured) the insights are sent as
+    server-sent events while they are generated
     """
     global hybrid_assistant
     
@@ -1164,11 +1602,7 @@ async def generate_chart_insights(request: Dict[str, Any]):
         date_to = request.get("date_to")
         
         # Load relevant data
-        df = load_data().copy()
-        if date_from:
-            df = df[df["date"] >= pd.to_datetime(date_from)]
-        if date_to:
-            df = df[df["date"] <= pd.to_datetime(date_to)]
+        df = filter_by_date(date_from, date_to)
         
         # Generate detailed context
         total_docs = len(df)
@@ -1183,60 +1617,24 @@ async def generate_chart_insights(request: Dict[str, Any]):
                 avg_sentiment = df["sentiment_score"].mean()
                 context_data = f"Average sentiment: {avg_sentiment:.3f}"
         elif "volume" in chart_type.lower() or "document" in chart_type.lower():
-            recent_count = len(df[df["date"] >= pd.to_datetime(date_from) if date_from else df["date"].max() - pd.Timedelta(days=90)])
+            since = _parse_date(date_from) if date_from else df["date"].max() - pd.Timedelta(days=90)
+            recent_count = int(np.count_nonzero(df["date"].to_numpy() >= since))
             context_data = f"Recent documents: {recent_count}"
         elif "authority" in chart_type.lower():
-            top_auth = df["authority"].value_counts().head(3)
+            top_auth = _value_counts(df["authority"]).head(3)
             context_data = f"Top authorities: {', '.join([f'{k} ({v})' for k, v in top_auth.items()])}"
         
         # Create detailed prompt for AI insights
         if hybrid_assistant and hybrid_assistant.llm:
             try:
-                prompt = f"""You are a senior business analyst writing a professional report. Generate a detailed analysis for this chart.
-
-CONTEXT:
-Chart: {chart_type}
-Section: {tab_name}
-Period: {date_range_str}
-Dataset: {total_docs:,} documents, {countries} countries, {authorities} authorities
-Additional: {context_data}
-
-INSTRUCTIONS:
-Write a professional analysis following this EXACT structure. Do NOT use asterisks, bullet points, or markdown. Write in plain text paragraphs with proper capitalization and punctuation.
-
-FORMAT:
-
-Based on the {chart_type} chart covering {date_range_str}, analyzing {total_docs:,} documents across {countries} countries and {authorities} authorities, the following insights were identified:
-
-Dominant Trends:
-Write 2-3 complete sentences describing the main trend or pattern visible in the chart. Include specific percentages or numbers from the data. Explain what this trend indicates for stakeholders and why it matters.
-
-Key Findings:
-Write 2-3 complete sentences identifying notable observations, anomalies, or significant changes in the data. Reference specific time periods, categories, or data points. Explain the likely causes or business implications of these findings.
-
-Comparative Analysis:
-Write 2-3 complete sentences comparing different segments such as countries, time periods, or categories. Highlight any outliers or significant differences. Provide potential explanations such as policy changes, economic factors, or market dynamics.
-
-Strategic Implications:
-Write 2-3 complete sentences explaining how these insights can inform decision-making, risk management, and strategic planning. Provide specific, actionable recommendations for stakeholders to consider implementing.
-
-CRITICAL RULES:
-- NO asterisks (**), NO bullet points, NO markdown
-- Write in complete sentences with proper grammar
-- Start each section header with a capital letter and end with a colon
-- Use professional business language
-- Include specific numbers and data points
-- Total length: 200-250 words
-- Write as if for an executive audience
-
-Generate the analysis now:"""
-
-                if hasattr(hybrid_assistant, 'llm_type') and hybrid_assistant.llm_type == "native":
-                    response = hybrid_assistant.llm.generate_content(prompt)
-                    insights = response.text
-                else:
-                    response = hybrid_assistant.llm.invoke(prompt)
-                    insights = response.content if hasattr(response, 'content') else str(response)
+                prompt = CHART_INSIGHTS_PROMPT.substitute(
+                    chart_type=chart_type, tab_name=tab_name, date_range=date_range_str, total_docs=f"{total_docs:,}",
+                    countries=countries, authorities=authorities, context_data=context_data
+                )
+
+                if request.get("stream"):
+                    return StreamingResponse(_stream_text(prompt), media_type="text/event-stream")
+                insights = await _generate_text_async(prompt)
                 
                 return {
                     "insights": insights,
@@ -1283,6 +1681,9 @@ This chart provides insights into AI regulation trends and patterns. For detaile
 async def chat_with_document(request: Dict[str, Any]):
     """
     Chat with an uploaded document - answer questions about the document
+    
+    With "stream": true (and an LLM configured) the answer is sent as
+    server-sent events while it is generated
     """
     global hybrid_assistant
     
@@ -1302,30 +1703,11 @@ async def chat_with_document(request: Dict[str, Any]):
         # Generate response using Gemini with document context
         if hybrid_assistant and hybrid_assistant.llm:
             try:
-                prompt = f"""You are a professional AI Regulation & Compliance Assistant. Answer the user's question based on the uploaded document.
-
-**Document:** {filename}
-
-**Document Content:**
-{doc_content[:20000]}
-
-**User Question:** {query}
-
-**Instructions:**
-- Answer directly and professionally
-- Cite specific sections from the document when relevant
-- Use clear formatting with headings and bullet points
-- If the answer isn't in the document, say so clearly
-
-**Your Answer:**"""
+                prompt = DOCUMENT_CHAT_PROMPT.substitute(filename=filename, document=doc_content[:20000], query=query)
 
-                # Check if using native Gemini SDK or LangChain
-                if hasattr(hybrid_assistant, 'llm_type') and hybrid_assistant.llm_type == "native":
-                    response = hybrid_assistant.llm.generate_content(prompt)
-                    answer = response.text
-                else:
-                    response = hybrid_assistant.llm.invoke(prompt)
-                    answer = response.content if hasattr(response, 'content') else str(response)
+                if request.get("stream"):
+                    return StreamingResponse(_stream_text(prompt), media_type="text/event-stream")
+                answer = await _generate_text_async(prompt)
                 
                 return {
                     "answer": answer,
@@ -1349,6 +1731,35 @@ async def chat_with_document(request: Dict[str, Any]):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
 
+def _extract_text(content: bytes, file_ext: str) -> str:
+    """Plain text of an uploaded PDF, DOCX or TXT file, parsed straight from its bytes"""
+    if file_ext == '.pdf':
+        # Extract text from PDF with MuPDF's C extractor when installed (imported here: only uploads need it)
+        try:
+            import fitz
+        except ImportError:
+            fitz = None
+        if fitz is not None:
+            with fitz.open(stream=content, filetype="pdf") as pdf:
+                return "".join([page.get_text() for page in pdf])
+        
+        # Pure-Python fallback
+        import PyPDF2
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+        return "".join([page.extract_text() + "\n" for page in pdf_reader.pages])
+    
+    if file_ext == '.docx':
+        # Extract text from DOCX (imported here: only uploads need it)
+        import docx
+        doc = docx.Document(io.BytesIO(content))
+        return "\n".join([paragraph.text for paragraph in doc.paragraphs])
+    
+    if file_ext == '.txt':
+        # Read text file
+        return content.decode('utf-8', errors='ignore')
+    
+    return ""
+
 @app.post("/api/upload-document")
 async def upload_document(file: UploadFile = File(...)):
     """
@@ -1371,38 +1782,8 @@ async def upload_document(file: UploadFile = File(...)):
         # Read file content
         content = await file.read()
         
-        # Extract text based on file type
-        text_content = ""
-        
-        if file_ext == '.pdf':
-            # Extract text from PDF
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                tmp_file.write(content)
-                tmp_file_path = tmp_file.name
-            
-            try:
-                with open(tmp_file_path, 'rb') as pdf_file:
-                    pdf_reader = PyPDF2.PdfReader(pdf_file)
-                    for page in pdf_reader.pages:
-                        text_content += page.extract_text() + "\n"
-            finally:
-                os.unlink(tmp_file_path)
-        
-        elif file_ext == '.docx':
-            # Extract text from DOCX
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-                tmp_file.write(content)
-                tmp_file_path = tmp_file.name
-            
-            try:
-                doc = docx.Document(tmp_file_path)
-                text_content = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            finally:
-                os.unlink(tmp_file_path)
-        
-        elif file_ext == '.txt':
-            # Read text file
-            text_content = content.decode('utf-8', errors='ignore')
+        # Extract text based on file type; parsing is CPU-bound, so keep it off the event loop
+        text_content = await asyncio.get_running_loop().run_in_executor(None, _extract_text, content, file_ext)
         
         # Limit text length for API
         max_chars = 30000  # Gemini has token limits
@@ -1412,65 +1793,9 @@ async def upload_document(file: UploadFile = File(...)):
         # Generate analysis using Gemini
         if hybrid_assistant and hybrid_assistant.llm:
             try:
-                analysis_prompt = f"""You are a professional AI Regulation & Compliance Analyst. Analyze the following legal/regulatory document and provide a comprehensive, well-structured report.
-
-**Document:** {file.filename}
-
-**Analysis Requirements:**
-
-# 📋 Executive Summary
-Provide a 2-3 sentence overview of the document's purpose and significance.
-
-# 🎯 Key Regulations & Guidelines
-List the main regulatory requirements and compliance guidelines with specific references.
-
-# ✅ Compliance Requirements
-Detail specific actions, standards, or obligations that organizations must follow:
-- Use bullet points for clarity
-- Include specific requirements
-- Note any deadlines or timelines
-
-# ⚠️ Risk Assessment
-Identify potential compliance risks and areas of concern:
-- High-risk areas
-- Common pitfalls
-- Recommended mitigation strategies
-
-# 🤖 Relevant AI/ML Technologies
-List AI/ML technologies or systems mentioned:
-- Facial recognition
-- Computer vision
-- Natural language processing
-- Machine learning models
-- Other relevant technologies
-
-# 🌍 Geographic Scope
-Specify jurisdictions, regions, or countries covered by this regulation.
-
-# 💡 Key Takeaways
-Provide 5-7 actionable bullet points summarizing the most critical information for compliance officers and AI developers.
-
----
-
-**Document Content:**
-{text_content}
-
----
+                analysis_prompt = DOCUMENT_ANALYSIS_PROMPT.substitute(filename=file.filename, document=text_content)
 
-**Provide your professional analysis below:**"""
-
-                # Check if using native Gemini SDK or LangChain
-                if hasattr(hybrid_assistant, 'llm_type') and hybrid_assistant.llm_type == "native":
-                    # Native Google Generative AI SDK
-                    response = hybrid_assistant.llm.generate_content(analysis_prompt)
-                    analysis = response.text
-                else:
-                    # LangChain wrapper
-                    response = hybrid_assistant.llm.invoke(analysis_prompt)
-                    if hasattr(response, 'content'):
-                        analysis = response.content
-                    else:
-                        analysis = str(response)
+                analysis = await _generate_text_async(analysis_prompt)
                 
                 return {
                     "success": True,